@@ -31,6 +31,7 @@ class Settings:
 
     # Streaming settings
     STREAM_DELAY: float = 0.1  # Delay between chunks in seconds
+    STREAM_COALESCE_WINDOW_MS: float = 1.0  # Window for merging back-to-back chunks into one write
 
     # Component streaming settings (Phase 1)
     ENABLE_COMPONENTS: bool = True  # Enable JSON component streaming
@@ -13,10 +13,33 @@ Architecture:
 Run with: uvicorn main:app --reload
 """
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config.settings import settings
 from routers import chat
+from services.llm import llm_planner_service
+
+logger = logging.getLogger("main")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: open shared clients on startup, close on shutdown.
+
+    The LLM planner keeps one Bedrock client for all requests instead of
+    creating a client (and a new TLS connection) per call.
+    """
+    try:
+        await llm_planner_service.start()
+    except Exception as e:
+        # The planner opens the client on first use if this fails
+        logger.warning(f"Bedrock client not started: {e}")
+    yield
+    await llm_planner_service.close()
 
 
 # Initialize FastAPI application
@@ -24,6 +47,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Streaming chat API with real-time SSE responses",
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware for React frontend
@@ -8,7 +8,7 @@ including streaming responses using Server-Sent Events (SSE).
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from services.streaming_service import generate_chunks
+from services.streaming_service import generate_chunks, coalesce_chunks
 
 
 # Create router for chat endpoints
@@ -73,7 +73,8 @@ async def chat_stream(request: ChatRequest):
         ...
     """
     return StreamingResponse(
-        generate_chunks(request.message),
+        # Merge back-to-back chunks so bursts go out as one write
+        coalesce_chunks(generate_chunks(request.message)),
         media_type="text/plain",  # Changed from text/event-stream for better streaming
         headers={
             "Cache-Control": "no-cache, no-store, must-revalidate",
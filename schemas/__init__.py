@@ -1,5 +1,15 @@
 """Schemas package for data models and validation."""
 
-from .component_schemas import ComponentData, SimpleComponentData
+from .component_schemas import (
+    ComponentData,
+    SimpleComponentData,
+    PlannedComponent,
+    PLANNED_COMPONENT_ADAPTER,
+)
 
-__all__ = ["ComponentData", "SimpleComponentData"]
+__all__ = [
+    "ComponentData",
+    "SimpleComponentData",
+    "PlannedComponent",
+    "PLANNED_COMPONENT_ADAPTER",
+]
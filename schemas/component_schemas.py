@@ -6,8 +6,8 @@ alongside text in the chat response. Components are rendered as
 React components on the frontend.
 """
 
-from pydantic import BaseModel, Field
-from typing import Any, Optional, Literal
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Annotated, Any, Optional, Literal, Union
 from datetime import datetime, timezone
 
 
@@ -175,3 +175,72 @@ class FormComponentData(BaseModel):
     - validation: Validation rules
     """
     pass
+
+
+# ============================================================================
+# Phase 6: LLM Planner Component Plans
+# ============================================================================
+# Schemas for the component plans returned by the LLM planner. They only
+# check the shape the frontend relies on; unknown keys are kept so the plan
+# dict can be streamed as-is once it validates.
+
+class PlannedSimpleData(BaseModel):
+    """Planned SimpleComponent payload: a title is required."""
+    title: Any
+
+    class Config:
+        extra = "allow"
+
+
+class PlannedTableData(BaseModel):
+    """Planned TableA payload: non-empty columns and a list of row lists."""
+    columns: list[Any] = Field(..., min_length=1)
+    rows: list[list[Any]]
+
+    class Config:
+        extra = "allow"
+
+
+class PlannedChartSeries(BaseModel):
+    """One series of a planned chart."""
+    label: Any
+    values: list[Any]
+
+    class Config:
+        extra = "allow"
+
+
+class PlannedChartData(BaseModel):
+    """Planned ChartComponent payload."""
+    chart_type: Literal["line", "bar", "area", "pie", "scatter"]
+    title: Any
+    x_axis: list[Any]
+    series: list[PlannedChartSeries] = Field(..., min_length=1)
+
+    class Config:
+        extra = "allow"
+
+
+class PlannedSimpleComponent(BaseModel):
+    type: Literal["SimpleComponent"]
+    data: PlannedSimpleData
+
+
+class PlannedTableComponent(BaseModel):
+    type: Literal["TableA"]
+    data: PlannedTableData
+
+
+class PlannedChartComponent(BaseModel):
+    type: Literal["ChartComponent"]
+    data: PlannedChartData
+
+
+# Dispatches on "type", so each plan is checked against one schema only
+PlannedComponent = Annotated[
+    Union[PlannedSimpleComponent, PlannedTableComponent, PlannedChartComponent],
+    Field(discriminator="type")
+]
+
+# Built once; validation runs in pydantic-core
+PLANNED_COMPONENT_ADAPTER = TypeAdapter(PlannedComponent)
@@ -8,27 +8,283 @@ Phase 6: LLM-Driven Dynamic Component Generation
 """
 
 import asyncio
+import functools
 import json
 import logging
 import hashlib
 import time
 import re
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
+from datetime import datetime
 
 try:
     import aioboto3
     import botocore.exceptions
+    from aiobotocore.config import AioConfig
     BEDROCK_AVAILABLE = True
 except ImportError:
     BEDROCK_AVAILABLE = False
 
-from utils.id_generator import generate_uuid7
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+from pydantic import ValidationError
+
+from schemas.component_schemas import PLANNED_COMPONENT_ADAPTER
+from utils.id_generator import generate_component_ids
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("llm_planner")
 
+# JSON codec for Bedrock I/O: orjson when installed, stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+if ORJSON_AVAILABLE:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# LLM response patterns, compiled once at import
+# Component array between $$$ delimiters
+_DELIMITED_RE = re.compile(r'\$\$\$(.*?)\$\$\$', re.DOTALL)
+# Loose fallback: outermost JSON object or array in free-form text
+_LOOSE_RE = re.compile(r'\{.*\}|\[.*\]', re.DOTALL)
+
+
+def _strip_code_fence(text: str) -> str:
+    """
+    Remove markdown code fences (``` or ~~~) from around ``text``.
+
+    The opening fence (with its optional language tag) and the closing fence
+    are detected independently, so output fenced on one side only still
+    parses. Both ends are bounds checks on the already-stripped text; the
+    body is cut out with a single slice.
+
+    Args:
+        text: Stripped LLM output
+
+    Returns:
+        Text without the fences, stripped
+    """
+    start = 0
+    end = len(text)
+
+    # Leading fence plus a language tag glued to it (```json, ~~~yaml, ...)
+    if text[:3] in ("```", "~~~"):
+        start = 3
+        while start < end and text[start].isalnum():
+            start += 1
+
+    # Trailing fence (not overlapping the leading one)
+    if end - start >= 3 and text[end - 3:] in ("```", "~~~"):
+        end -= 3
+
+    if start == 0 and end == len(text):
+        return text
+    return text[start:end].strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_request_body(anthropic_version: str, prompt: str) -> bytes:
+    """
+    Serialize a Claude request body for Bedrock.
+
+    Memoized so retries and repeated prompts reuse the encoded bytes; the
+    result is immutable, so sharing it between concurrent requests is safe.
+    """
+    return _json_dumps({
+        "anthropic_version": anthropic_version,
+        "max_tokens": 4096,
+        "temperature": 0.3,
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    })
+
+
+def _decode_component(fragment: str) -> Any:
+    """Decode one component's JSON, retrying with single quotes fixed up."""
+    try:
+        return _json_loads(fragment)
+    except json.JSONDecodeError:
+        return _json_loads(fragment.replace("'", '"'))
+
+
+class _ComponentStreamParser:
+    """
+    Incremental parser for a streamed JSON array of component objects.
+
+    Text is fed as the model produces it; each top-level object in the array
+    is decoded as soon as its closing brace arrives. Anything before the
+    opening '[' (markdown fence, $$$ delimiter) or after the closing ']' is
+    ignored. Like the non-streaming parser, it also accepts a single bare
+    object instead of an array, and single-quoted pseudo-JSON.
+    """
+
+    __slots__ = ("_buf", "_pos", "_start", "_depth", "_quote", "_escape", "_state")
+
+    _BEFORE_ARRAY, _IN_ARRAY, _SINGLE_OBJECT, _DONE = range(4)
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0  # Next offset in _buf to scan
+        self._start = 0  # Offset of the open object's '{' in _buf
+        self._depth = 0  # Brace/bracket depth inside the open object
+        self._quote = ""  # Quote character of the open string, if any
+        self._escape = False
+        self._state = self._BEFORE_ARRAY
+
+    @property
+    def done(self) -> bool:
+        """True once the array (or bare object) has been closed."""
+        return self._state == self._DONE
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Consume the next piece of model output.
+
+        Args:
+            text: Newly received text
+
+        Returns:
+            Components (decoded objects) completed by this piece
+        """
+        if self._state == self._DONE:
+            return []
+
+        buf = self._buf + text
+        i = self._pos
+        n = len(buf)
+        completed = []
+
+        if self._state == self._BEFORE_ARRAY:
+            bracket = buf.find("[", i)
+            brace = buf.find("{", i)
+            if bracket < 0 and brace < 0:
+                self._buf, self._pos = "", 0
+                return completed
+            if brace >= 0 and (bracket < 0 or brace < bracket):
+                # Bare object: it is the whole layout
+                self._state = self._SINGLE_OBJECT
+                i = brace
+            else:
+                self._state = self._IN_ARRAY
+                i = bracket + 1
+
+        state = self._state
+        depth = self._depth
+        quote = self._quote
+        escape = self._escape
+        start = self._start
+        while i < n:
+            ch = buf[i]
+            if quote:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == quote:
+                    quote = ""
+            elif depth == 0:
+                # Between array elements
+                if ch == "{":
+                    start = i
+                    depth = 1
+                elif ch == "]" and state == self._IN_ARRAY:
+                    state = self._DONE
+                    break
+            elif ch == '"' or ch == "'":
+                quote = ch
+            elif ch == "{" or ch == "[":
+                depth += 1
+            elif ch == "}" or ch == "]":
+                depth -= 1
+                if depth == 0:
+                    fragment = buf[start:i + 1]
+                    try:
+                        completed.append(_decode_component(fragment))
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping undecodable streamed component: {e}")
+                    if state == self._SINGLE_OBJECT:
+                        state = self._DONE
+                        i += 1
+                        break
+            i += 1
+
+        # Keep only the unfinished object (if any) for the next feed
+        keep_from = start if depth else i
+        self._buf = buf[keep_from:]
+        self._pos = i - keep_from
+        self._start = start - keep_from if depth else 0
+        self._depth = depth
+        self._quote = quote
+        self._escape = escape
+        self._state = state
+        return completed
+
+
+class _LayoutBroadcast:
+    """
+    Components of one in-flight layout generation, shared by its readers.
+
+    The generating task publishes each component as soon as it is planned;
+    every subscriber replays what was published so far and then follows
+    along, so concurrent identical requests share a single Bedrock stream.
+    """
+
+    __slots__ = ("components", "done", "_waiters")
+
+    def __init__(self):
+        self.components: List[Dict[str, Any]] = []
+        self.done = False
+        self._waiters: List[asyncio.Future] = []
+
+    def publish(self, component: Dict[str, Any]) -> None:
+        """Append a planned component and wake the subscribers."""
+        self.components.append(component)
+        self._wake()
+
+    def finish(self) -> None:
+        """Mark the layout complete and wake the subscribers."""
+        self.done = True
+        self._wake()
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def subscribe(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every component of the layout, from the first, as it is published."""
+        index = 0
+        while True:
+            while index < len(self.components):
+                yield self.components[index]
+                index += 1
+            if self.done:
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+
 
 class LLMPlannerService:
     """
@@ -37,7 +293,8 @@ class LLMPlannerService:
     Features:
     - AWS Bedrock integration (Anthropic Claude 3.5 Haiku)
     - Intelligent component selection based on user intent
-    - Caching for performance optimization
+    - Bounded LRU caching with TTL for performance optimization
+    - Single-flight deduplication of concurrent identical requests
     - Retry logic with exponential backoff
     - Schema validation and error recovery
     - Fallback to default components on failure
@@ -48,30 +305,49 @@ class LLMPlannerService:
         # Returns: {"components": [...], "from_cache": False, ...}
     """
 
+    # Fixed instance layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "_cache",
+        "_inflight",
+        "_session",
+        "_client_ctx",
+        "_client",
+        "_client_lock",
+    )
+
     # Configuration constants
     BEDROCK_MODEL_ID = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
     ANTHROPIC_VERSION = "bedrock-2023-05-31"
     APPLICATION_JSON = "application/json"
     MAX_RETRIES = 3
     CACHE_TTL_SECONDS = 3600
+    CACHE_MAX_ENTRIES = 256
     AWS_REGION = "us-east-1"
 
-    # Component validation rules
-    REQUIRED_FIELDS = {
-        "SimpleComponent": ["title"],
-        "TableA": ["columns", "rows"],
-        "ChartComponent": ["chart_type", "title", "x_axis", "series"]
-    }
+    # Connection pool for the shared Bedrock client: enough sockets for
+    # concurrent requests, kept alive between calls so they skip TCP/TLS setup
+    BEDROCK_MAX_POOL_CONNECTIONS = 50
+    BEDROCK_KEEPALIVE_TIMEOUT_SECONDS = 60
 
-    VALID_CHART_TYPES = ["line", "bar", "area", "pie", "scatter"]
+    # Component limits (schema rules live in schemas.component_schemas.PlannedComponent)
     MAX_COMPONENTS = 5
     MAX_TABLE_ROWS = 20
     MAX_CHART_POINTS = 50
 
     def __init__(self):
         """Initialize the LLM Planner Service."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # (monotonic expiry, cache-hit result) pairs, least recently used first;
+        # bounded by CACHE_MAX_ENTRIES
+        self._cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Layout generations currently running, keyed like the cache, so
+        # concurrent identical requests share a single Bedrock stream
+        self._inflight: Dict[int, Tuple["asyncio.Task[Dict[str, Any]]", _LayoutBroadcast]] = {}
+        # One Bedrock client for the service's lifetime (see start/close), so
+        # requests reuse its connection pool instead of reconnecting each time
         self._session = None
+        self._client_ctx = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
 
         if not BEDROCK_AVAILABLE:
             logger.warning(
@@ -79,6 +355,48 @@ class LLMPlannerService:
                 "Install with: pip install aioboto3 boto3 botocore"
             )
 
+    async def start(self) -> None:
+        """
+        Open the shared Bedrock runtime client.
+
+        Called from the application lifespan on startup; safe to call again
+        and a no-op when the Bedrock dependencies are not installed.
+        """
+        if not BEDROCK_AVAILABLE:
+            return
+
+        async with self._client_lock:
+            if self._client is not None:
+                return
+
+            self._session = aioboto3.Session()
+            client_ctx = self._session.client(
+                service_name='bedrock-runtime',
+                region_name=self.AWS_REGION,
+                config=AioConfig(
+                    max_pool_connections=self.BEDROCK_MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True,
+                    connector_args={
+                        "keepalive_timeout": self.BEDROCK_KEEPALIVE_TIMEOUT_SECONDS
+                    }
+                )
+            )
+            self._client = await client_ctx.__aenter__()
+            self._client_ctx = client_ctx
+            logger.info("Bedrock client opened")
+
+    async def close(self) -> None:
+        """Close the shared Bedrock runtime client (application shutdown)."""
+        async with self._client_lock:
+            client_ctx = self._client_ctx
+            if client_ctx is None:
+                return
+
+            self._client_ctx = None
+            self._client = None
+            await client_ctx.__aexit__(None, None, None)
+            logger.info("Bedrock client closed")
+
     def _calculate_backoff_time(self, attempt: int) -> float:
         """
         Calculate exponential backoff time for retry attempts.
@@ -100,6 +418,10 @@ class LLMPlannerService:
         """
         Interpret natural language and produce component layout plan.
 
+        Built on the same streamed generation as generate_layout_stream:
+        this waits for the whole layout instead of taking components one
+        at a time.
+
         Args:
             user_message: User's natural language request
 
@@ -107,8 +429,12 @@ class LLMPlannerService:
             Dict containing:
             - components: List of component dictionaries with type, id, data
             - from_cache: Whether result came from cache
-            - processing_time_ms: Time taken to generate
+            - processing_time_ms: Time taken to generate (for cache hits,
+              the time the cached layout originally took)
             - model_id: Model used for generation
+            - fallback: Present (True) when the default components were used
+            - partial: Present (True) when the Bedrock stream broke after
+              some components had been produced (not cached)
 
         Example:
             >>> result = await service.generate_layout("show me sales data")
@@ -138,61 +464,213 @@ class LLMPlannerService:
         cached_result = self._get_from_cache(cache_key)
         if cached_result:
             logger.info(f"Cache hit for message: {user_message[:50]}...")
-            processing_time = (time.time() - start_time) * 1000
-            return {
-                **cached_result,
-                "from_cache": True,
-                "processing_time_ms": processing_time
-            }
+            return cached_result
+
+        task, _ = self._join_or_start(user_message, cache_key, start_time)
+
+        # Shielded so a cancelled caller does not cancel the shared generation
+        return await asyncio.shield(task)
+
+    async def generate_layout_stream(
+        self,
+        user_message: str,
+        on_complete: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the component layout plan, one component at a time.
 
+        Uses Bedrock's streaming API and yields each validated component
+        (with its UUID assigned) as soon as the model finishes writing it,
+        instead of waiting for the whole response. Cached layouts are
+        replayed, and a request identical to one already in flight follows
+        that generation instead of starting another. If generation fails
+        before any component was produced, the fallback components are
+        yielded instead.
+
+        Args:
+            user_message: User's natural language request
+            on_complete: Called with the layout dictionary (as returned by
+                generate_layout, including from_cache and processing_time_ms)
+                once every component has been yielded
+
+        Yields:
+            Component dictionaries with type, id, data
+        """
+        start_time = time.time()
+
+        if not user_message or not user_message.strip():
+            logger.warning("Empty user message, returning fallback components")
+            result = self._create_fallback_response(start_time)
+            for component in result["components"]:
+                yield component
+        else:
+            cache_key = self._generate_cache_key(user_message)
+            result = self._get_from_cache(cache_key)
+            if result:
+                logger.info(f"Cache hit for message: {user_message[:50]}...")
+                for component in result["components"]:
+                    yield component
+            else:
+                task, layout = self._join_or_start(user_message, cache_key, start_time)
+                async for component in layout.subscribe():
+                    yield component
+                result = await asyncio.shield(task)
+
+        if on_complete is not None:
+            on_complete(result)
+
+    def _join_or_start(
+        self,
+        user_message: str,
+        cache_key: int,
+        start_time: float
+    ) -> Tuple["asyncio.Task[Dict[str, Any]]", _LayoutBroadcast]:
+        """
+        Return the generation in flight for cache_key, starting one if needed.
+
+        Args:
+            user_message: User's natural language request
+            cache_key: Cache key for user_message
+            start_time: Request start time for metrics
+
+        Returns:
+            (task resolving to the layout dictionary, broadcast of its components)
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.info(f"Joining in-flight request for message: {user_message[:50]}...")
+            return inflight
+
+        layout = _LayoutBroadcast()
+        task = asyncio.ensure_future(
+            self._plan_layout(user_message, cache_key, start_time, layout)
+        )
+        inflight = self._inflight[cache_key] = (task, layout)
+
+        def on_done(_):
+            self._inflight.pop(cache_key, None)
+            # Also ends the subscribers if the task was cancelled before it ran
+            layout.finish()
+
+        task.add_done_callback(on_done)
+        return inflight
+
+    async def _plan_layout(
+        self,
+        user_message: str,
+        cache_key: int,
+        start_time: float,
+        layout: _LayoutBroadcast
+    ) -> Dict[str, Any]:
+        """
+        Stream a layout from Bedrock into ``layout`` and cache it (cache miss path).
+
+        Args:
+            user_message: User's natural language request
+            cache_key: Cache key for user_message
+            start_time: Request start time for metrics
+            layout: Broadcast that receives each component as it is planned
+
+        Returns:
+            Layout dictionary as described in generate_layout
+        """
         # Check if Bedrock is available
         if not BEDROCK_AVAILABLE:
             logger.warning("Bedrock not available, using fallback components")
-            return self._create_fallback_response(start_time)
+            return self._publish_fallback(layout, start_time)
 
+        completed = False
         try:
-            # Build planning prompt
-            prompt = self._create_planning_prompt(user_message)
-
-            # Call Bedrock API
-            llm_response = await self._call_bedrock_api(prompt)
+            await self._stream_components(user_message, layout)
+            completed = True
+        except Exception as e:
+            logger.error(f"Error generating layout: {e}", exc_info=True)
 
-            # Parse and validate response
-            components = self._parse_llm_response(llm_response)
+        if not layout.components:
+            logger.warning("No valid components generated, using fallback")
+            return self._publish_fallback(layout, start_time)
 
-            # Assign UUIDs and validate schemas
-            validated_components = []
-            for component in components[:self.MAX_COMPONENTS]:
-                if self._validate_component_schema(component):
-                    component["id"] = generate_uuid7()
-                    validated_components.append(component)
-
-            if not validated_components:
-                logger.warning("No valid components after validation, using fallback")
-                return self._create_fallback_response(start_time)
-
-            # Build result
-            processing_time = (time.time() - start_time) * 1000
-            result = {
-                "components": validated_components,
-                "from_cache": False,
-                "processing_time_ms": processing_time,
-                "model_id": self.BEDROCK_MODEL_ID
-            }
+        # Build result
+        processing_time = (time.time() - start_time) * 1000
+        result = {
+            "components": layout.components,
+            "from_cache": False,
+            "processing_time_ms": processing_time,
+            "model_id": self.BEDROCK_MODEL_ID
+        }
 
-            # Store in cache
+        # Only complete layouts are cached
+        if completed:
             self._store_in_cache(cache_key, result)
-
-            logger.info(
-                f"Generated {len(validated_components)} components "
-                f"in {processing_time:.1f}ms"
+        else:
+            logger.warning(
+                f"Bedrock stream failed after {len(layout.components)} components, "
+                f"returning a partial layout"
             )
+            result["partial"] = True
 
-            return result
+        logger.info(
+            f"Generated {len(layout.components)} components "
+            f"in {processing_time:.1f}ms"
+        )
 
-        except Exception as e:
-            logger.error(f"Error generating layout: {e}", exc_info=True)
-            return self._create_fallback_response(start_time)
+        return result
+
+    async def _stream_components(self, user_message: str, layout: _LayoutBroadcast) -> None:
+        """
+        Publish validated components to ``layout`` as the model writes them.
+
+        If the incremental parser finds no component at all (for example when
+        prose with brackets precedes the $$$ array), the full response text
+        is parsed once more with the lenient whole-text parser.
+
+        Args:
+            user_message: User's natural language request
+            layout: Broadcast that receives each component
+
+        Raises:
+            Exception: If the Bedrock stream cannot be opened or breaks
+        """
+        # IDs for the largest possible layout, minted in one batch
+        component_ids = generate_component_ids(self.MAX_COMPONENTS)
+
+        def publish(component: Dict[str, Any]) -> None:
+            if self._validate_component_schema(component):
+                component["id"] = component_ids[len(layout.components)]
+                layout.publish(component)
+
+        parser = _ComponentStreamParser()
+        text_parts = []
+        seen = 0
+        text_stream = self._stream_bedrock_api(self._create_planning_prompt(user_message))
+        try:
+            async for text in text_stream:
+                text_parts.append(text)
+                for component in parser.feed(text):
+                    seen += 1
+                    if seen > self.MAX_COMPONENTS:
+                        break
+                    publish(component)
+                # An array that closed empty is read to the end for the retry below
+                if seen >= self.MAX_COMPONENTS or (parser.done and seen):
+                    break
+        finally:
+            await text_stream.aclose()
+
+        if seen == 0 and text_parts:
+            try:
+                components = self._parse_llm_response("".join(text_parts))
+            except ValueError:
+                return
+            for component in components[:self.MAX_COMPONENTS]:
+                publish(component)
+
+    def _publish_fallback(self, layout: _LayoutBroadcast, start_time: float) -> Dict[str, Any]:
+        """Publish the fallback components to ``layout`` and return the fallback response."""
+        result = self._create_fallback_response(start_time)
+        for component in result["components"]:
+            layout.publish(component)
+        return result
 
     def _create_planning_prompt(self, user_message: str) -> str:
         """
@@ -249,63 +727,40 @@ Output only the $$$ JSON array $$$ with no extra text.
 
         return prompt
 
-    async def _call_bedrock_api(self, prompt: str) -> str:
+    def _build_request_body(self, prompt: str) -> bytes:
+        """Serialize the Claude request body for a planning prompt (memoized)."""
+        return _encode_request_body(self.ANTHROPIC_VERSION, prompt)
+
+    async def _stream_bedrock_api(self, prompt: str) -> AsyncIterator[str]:
         """
-        Call AWS Bedrock API with retries and exponential backoff.
+        Call AWS Bedrock's streaming API and yield the response text as it arrives.
+
+        Opening the stream is retried with exponential backoff; once text
+        has started flowing, errors propagate.
 
         Args:
             prompt: The prompt to send to the LLM
 
-        Returns:
-            LLM response text
-
-        Raises:
-            Exception: If all retries fail
+        Yields:
+            Text deltas from the model
         """
-        if self._session is None:
-            self._session = aioboto3.Session()
+        # Opened on first use when the app lifespan has not started the service
+        if self._client is None:
+            await self.start()
+        bedrock_client = self._client
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                async with self._session.client(
-                    service_name='bedrock-runtime',
-                    region_name=self.AWS_REGION
-                ) as bedrock_client:
-
-                    # Prepare request body for Claude
-                    request_body = {
-                        "anthropic_version": self.ANTHROPIC_VERSION,
-                        "max_tokens": 4096,
-                        "temperature": 0.3,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
-                    }
-
-                    logger.info(
-                        f"Calling Bedrock API (attempt {attempt + 1}/{self.MAX_RETRIES})"
-                    )
-
-                    # Invoke model
-                    response = await bedrock_client.invoke_model(
-                        modelId=self.BEDROCK_MODEL_ID,
-                        contentType=self.APPLICATION_JSON,
-                        accept=self.APPLICATION_JSON,
-                        body=json.dumps(request_body)
-                    )
-
-                    # Parse response
-                    response_body = json.loads(await response['body'].read())
-
-                    if 'content' in response_body and len(response_body['content']) > 0:
-                        llm_text = response_body['content'][0]['text']
-                        logger.info(f"Received response from Bedrock: {len(llm_text)} chars")
-                        return llm_text
-                    else:
-                        raise ValueError("Invalid response format from Bedrock")
+                logger.info(
+                    f"Calling Bedrock streaming API (attempt {attempt + 1}/{self.MAX_RETRIES})"
+                )
+                response = await bedrock_client.invoke_model_with_response_stream(
+                    modelId=self.BEDROCK_MODEL_ID,
+                    contentType=self.APPLICATION_JSON,
+                    accept=self.APPLICATION_JSON,
+                    body=self._build_request_body(prompt)
+                )
+                break
 
             except botocore.exceptions.ClientError as e:
                 error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -321,13 +776,24 @@ Output only the $$$ JSON array $$$ with no extra text.
                     raise
 
             except Exception as e:
-                logger.error(f"Unexpected error calling Bedrock: {e}")
+                logger.error(f"Unexpected error calling Bedrock streaming API: {e}")
                 if attempt < self.MAX_RETRIES - 1:
                     await asyncio.sleep(self._calculate_backoff_time(attempt))
                 else:
                     raise
-
-        raise Exception(f"Failed to call Bedrock after {self.MAX_RETRIES} attempts")
+        else:
+            raise Exception(f"Failed to call Bedrock after {self.MAX_RETRIES} attempts")
+
+        # Anthropic message events; only text deltas carry component JSON
+        async for event in response['body']:
+            chunk = event.get('chunk')
+            if chunk is None:
+                continue
+            payload = _json_loads(chunk['bytes'])
+            if payload.get('type') == 'content_block_delta':
+                text = payload['delta'].get('text')
+                if text:
+                    yield text
 
     def _parse_llm_response(self, llm_response: str) -> List[Dict[str, Any]]:
         """
@@ -349,7 +815,7 @@ Output only the $$$ JSON array $$$ with no extra text.
             ValueError: If JSON cannot be parsed
         """
         # Extract content between $$$ delimiters
-        match = re.search(r'\$\$\$(.*?)\$\$\$', llm_response, re.DOTALL)
+        match = _DELIMITED_RE.search(llm_response)
         if match:
             json_text = match.group(1).strip()
         else:
@@ -357,10 +823,13 @@ Output only the $$$ JSON array $$$ with no extra text.
             json_text = llm_response.strip()
 
         # Remove markdown code blocks
-        json_text = re.sub(r'^```json\s*', '', json_text)
-        json_text = re.sub(r'^```\s*', '', json_text)
-        json_text = re.sub(r'\s*```$', '', json_text)
-        json_text = json_text.strip()
+        json_text = _strip_code_fence(json_text)
+
+        # Without delimiters, fall back to the outermost object/array in the text
+        if not match and json_text[:1] not in ('[', '{'):
+            loose = _LOOSE_RE.search(json_text)
+            if loose:
+                json_text = loose.group(0)
 
         # Fix common JSON errors
         # Replace single quotes with double quotes
@@ -368,7 +837,7 @@ Output only the $$$ JSON array $$$ with no extra text.
 
         # Parse JSON
         try:
-            components = json.loads(json_text)
+            components = _json_loads(json_text)
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
             logger.debug(f"Failed JSON text: {json_text[:500]}")
@@ -386,131 +855,92 @@ Output only the $$$ JSON array $$$ with no extra text.
         """
         Validate component structure and required fields.
 
+        Checks the plan against the discriminated PlannedComponent schema,
+        then truncates oversized tables and chart series in place.
+
         Args:
             component: Component dictionary to validate
 
         Returns:
             True if valid, False otherwise
         """
-        # Check basic structure
-        if not isinstance(component, dict):
-            logger.warning("Component is not a dictionary")
-            return False
-
-        if "type" not in component:
-            logger.warning("Component missing 'type' field")
-            return False
-
-        if "data" not in component:
-            logger.warning(f"Component missing 'data' field: {component['type']}")
+        # Strict mode keeps list/dict checks exact (no tuple -> list coercion)
+        try:
+            PLANNED_COMPONENT_ADAPTER.validate_python(component, strict=True)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"]) or "component"
+            logger.warning(f"Invalid component ({location}): {error['msg']}")
             return False
 
         component_type = component["type"]
         component_data = component["data"]
 
-        # Validate component type
-        if component_type not in self.REQUIRED_FIELDS:
-            logger.warning(f"Unknown component type: {component_type}")
-            return False
-
-        # Check required fields for type
-        required = self.REQUIRED_FIELDS[component_type]
-        for field in required:
-            if field not in component_data:
-                logger.warning(
-                    f"{component_type} missing required field: {field}"
-                )
-                return False
-
-        # Type-specific validation
+        # Limit rows
         if component_type == "TableA":
-            columns = component_data.get("columns", [])
-            rows = component_data.get("rows", [])
-
-            if not isinstance(columns, list) or not columns:
-                logger.warning("TableA columns must be non-empty list")
-                return False
-
-            if not isinstance(rows, list):
-                logger.warning("TableA rows must be a list")
-                return False
-
-            # Limit rows
+            rows = component_data["rows"]
             if len(rows) > self.MAX_TABLE_ROWS:
                 logger.info(f"Truncating table rows from {len(rows)} to {self.MAX_TABLE_ROWS}")
                 component_data["rows"] = rows[:self.MAX_TABLE_ROWS]
 
-            # Validate row structure
-            for row in component_data["rows"]:
-                if not isinstance(row, list):
-                    logger.warning("TableA row is not a list")
-                    return False
-
+        # Limit data points
         elif component_type == "ChartComponent":
-            chart_type = component_data.get("chart_type")
-            if chart_type not in self.VALID_CHART_TYPES:
-                logger.warning(f"Invalid chart_type: {chart_type}")
-                return False
-
-            x_axis = component_data.get("x_axis", [])
-            series = component_data.get("series", [])
-
-            if not isinstance(x_axis, list):
-                logger.warning("ChartComponent x_axis must be a list")
-                return False
-
-            if not isinstance(series, list) or not series:
-                logger.warning("ChartComponent series must be non-empty list")
-                return False
-
-            # Validate series structure
-            for s in series:
-                if not isinstance(s, dict):
-                    logger.warning("ChartComponent series item must be dict")
-                    return False
-                if "label" not in s or "values" not in s:
-                    logger.warning("ChartComponent series missing label or values")
-                    return False
-                if not isinstance(s["values"], list):
-                    logger.warning("ChartComponent series values must be list")
-                    return False
-
-                # Limit data points
+            for s in component_data["series"]:
                 if len(s["values"]) > self.MAX_CHART_POINTS:
                     logger.info(f"Truncating chart points from {len(s['values'])} to {self.MAX_CHART_POINTS}")
                     s["values"] = s["values"][:self.MAX_CHART_POINTS]
 
         return True
 
-    def _generate_cache_key(self, user_message: str) -> str:
-        """Generate cache key from user message using SHA-256 hash."""
+    def _generate_cache_key(self, user_message: str) -> int:
+        """
+        Generate cache key from user message as a 128-bit integer digest.
+
+        The message is hashed once here (xxh3 when installed, BLAKE2b
+        otherwise); cache and in-flight lookups then hash a small int instead
+        of the full prompt string.
+        """
         normalized = user_message.strip().lower()
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_intdigest(normalized)
+        return int.from_bytes(
+            hashlib.blake2b(normalized.encode(), digest_size=16).digest(), "big"
+        )
 
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve cached result if not expired."""
-        if cache_key not in self._cache:
-            return None
+    def _get_from_cache(self, cache_key: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached result if not expired.
 
-        cached_entry = self._cache[cache_key]
-        expiry_time = cached_entry.get("expiry")
+        Returns the stored cache-hit variant (from_cache=True) by reference;
+        callers must not mutate it.
+        """
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
 
-        if expiry_time and datetime.now() > expiry_time:
+        expiry, result = entry
+        if time.monotonic() > expiry:
             # Cache expired
             del self._cache[cache_key]
             logger.info("Cache entry expired and removed")
             return None
 
+        # Mark as most recently used
+        self._cache.move_to_end(cache_key)
         logger.info("Cache hit")
-        return cached_entry.get("result")
-
-    def _store_in_cache(self, cache_key: str, result: Dict[str, Any]) -> None:
-        """Store result in cache with TTL."""
-        expiry = datetime.now() + timedelta(seconds=self.CACHE_TTL_SECONDS)
-        self._cache[cache_key] = {
-            "result": result,
-            "expiry": expiry
-        }
+        return result
+
+    def _store_in_cache(self, cache_key: int, result: Dict[str, Any]) -> None:
+        """Store result in cache with TTL, evicting the least recently used entry when full."""
+        # Build the variant served on hits once, so hits return it without copying
+        hit_result = {**result, "from_cache": True}
+        self._cache[cache_key] = (time.monotonic() + self.CACHE_TTL_SECONDS, hit_result)
+        self._cache.move_to_end(cache_key)
+
+        # Evict least recently used entries beyond the bound
+        while len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
         logger.info(f"Stored result in cache (TTL: {self.CACHE_TTL_SECONDS}s)")
 
     def clear_cache(self) -> None:
@@ -546,19 +976,23 @@ Output only the $$$ JSON array $$$ with no extra text.
         Returns:
             List of default components
         """
+        # One batch of ordered IDs and one timestamp for the whole layout
+        simple_id, table_id, chart_id = generate_component_ids(3)
+        timestamp = datetime.now().isoformat()
+
         return [
             {
                 "type": "SimpleComponent",
-                "id": generate_uuid7(),
+                "id": simple_id,
                 "data": {
                     "title": "Dashboard Summary",
                     "description": "Welcome to StreamForge. Your data will appear here.",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
             },
             {
                 "type": "TableA",
-                "id": generate_uuid7(),
+                "id": table_id,
                 "data": {
                     "columns": ["Metric", "Value", "Status"],
                     "rows": [
@@ -566,12 +1000,12 @@ Output only the $$$ JSON array $$$ with no extra text.
                         ["Revenue", "$45,678", "Up 12%"],
                         ["Conversion Rate", "3.2%", "Stable"]
                     ],
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
             },
             {
                 "type": "ChartComponent",
-                "id": generate_uuid7(),
+                "id": chart_id,
                 "data": {
                     "chart_type": "line",
                     "title": "Sample Trend",
@@ -582,7 +1016,7 @@ Output only the $$$ JSON array $$$ with no extra text.
                             "values": [100, 120, 150, 140, 180]
                         }
                     ],
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
             }
         ]
@@ -12,6 +12,10 @@ Phase 2: Progressive component rendering with multiple component support.
 Components are wrapped with $$$ delimiters:
 $$${"type":"SimpleComponent","id":"uuid","data":{...}}$$$
 
+Each yield is a flush boundary (one ASGI body event / socket write), so text
+and components emitted back-to-back without a pacing sleep are joined into a
+single chunk by the handlers.
+
 Modular Architecture (v0.6.0):
 - core.py: Shared utilities (tracking, validation)
 - constants.py: Configuration and pattern keywords
@@ -47,9 +51,11 @@ from .chart_component import (
 
 # Export core utilities
 from .core import (
+    Component,
     track_component,
     get_component_state,
     validate_component_update,
+    coalesce_chunks,
 )
 
 __all__ = [
@@ -77,9 +83,11 @@ __all__ = [
     "create_filled_chart",
     
     # Core utilities
+    "Component",
     "track_component",
     "get_component_state",
     "validate_component_update",
+    "coalesce_chunks",
 ]
 
 __version__ = "0.6.0"
@@ -14,7 +14,7 @@ from typing import AsyncGenerator, Dict
 from datetime import datetime
 
 from utils.id_generator import generate_uuid7
-from .core import track_component, get_component_state, format_component, logger
+from .core import Component, track_component, get_component_state, format_component, logger
 from .constants import (
     STREAM_DELAY, CHART_POINT_DELAY, SIMULATE_PROCESSING_TIME,
     MAX_CHARTS_PER_RESPONSE, MAX_CHART_POINTS, CHART_TYPES_PRESET
@@ -27,7 +27,7 @@ def create_empty_chart(
     title: str,
     x_axis: list[str],
     active_components: Dict[str, dict]
-) -> dict:
+) -> Component:
     """
     Create empty chart placeholder with metadata but no data points (Phase 4).
     
@@ -42,32 +42,25 @@ def create_empty_chart(
         active_components: Request-scoped component tracking dictionary
         
     Returns:
-        dict: Empty ChartComponent structure
+        Component: Empty ChartComponent structure
         
     Example:
         >>> chart = create_empty_chart("chart-1", "line", "Sales Trend", ["Jan", "Feb"], {})
-        >>> print(chart)
-        {
-            "type": "ChartComponent",
-            "id": "chart-1",
-            "data": {
-                "chart_type": "line",
-                "title": "Sales Trend",
-                "x_axis": ["Jan", "Feb"],
-                "series": []
-            }
-        }
+        >>> chart
+        Component(type='ChartComponent', id='chart-1',
+                  data={'chart_type': 'line', 'title': 'Sales Trend',
+                        'x_axis': ['Jan', 'Feb'], 'series': []})
     """
-    component = {
-        "type": "ChartComponent",
-        "id": chart_id,
-        "data": {
+    component = Component(
+        type="ChartComponent",
+        id=chart_id,
+        data={
             "chart_type": chart_type,
             "title": title,
             "x_axis": x_axis,
             "series": []
         }
-    }
+    )
     
     track_component(chart_id, {
         "chart_type": chart_type,
@@ -85,7 +78,7 @@ def create_cumulative_chart_update(
     new_values: list[float],
     series_label: str,
     active_components: Dict[str, dict]
-) -> dict:
+) -> Component:
     """
     Append data points to an existing chart series with cumulative values (Phase 4).
     
@@ -102,15 +95,17 @@ def create_cumulative_chart_update(
         active_components: Request-scoped component tracking dictionary
         
     Returns:
-        dict: ChartComponent update with CUMULATIVE values array
+        Component: ChartComponent update with CUMULATIVE values array
         
     Example:
         >>> # Initial state: []
         >>> update1 = create_cumulative_chart_update("chart-1", [1000], "Sales", {})
-        >>> # Returns: {"series": [{"label": "Sales", "values": [1000]}]}
+        >>> update1.data
+        {'series': [{'label': 'Sales', 'values': [1000]}]}
         >>> 
         >>> update2 = create_cumulative_chart_update("chart-1", [1200], "Sales", {})
-        >>> # Returns: {"series": [{"label": "Sales", "values": [1000, 1200]}]}  ← CUMULATIVE!
+        >>> update2.data  # ← CUMULATIVE!
+        {'series': [{'label': 'Sales', 'values': [1000, 1200]}]}
     """
     # Merge with existing state
     existing_data = get_component_state(chart_id, active_components)
@@ -148,13 +143,13 @@ def create_cumulative_chart_update(
     
     # CRITICAL: Return component with CUMULATIVE values (not just new_values)
     # This matches TableA behavior where backend sends cumulative rows
-    component = {
-        "type": "ChartComponent",
-        "id": chart_id,
-        "data": {
+    component = Component(
+        type="ChartComponent",
+        id=chart_id,
+        data={
             "series": [{"label": series_label, "values": cumulative_values}]  # ← CUMULATIVE!
         }
-    }
+    )
     
     return component
 
@@ -163,7 +158,7 @@ def create_filled_chart(
     chart_id: str,
     chart_data: dict,
     active_components: Dict[str, dict] = None
-) -> dict:
+) -> Component:
     """
     Create complete chart with all data (Phase 4).
     
@@ -176,7 +171,7 @@ def create_filled_chart(
         active_components: Request-scoped component tracking dictionary (optional)
         
     Returns:
-        dict: Complete ChartComponent structure
+        Component: Complete ChartComponent structure
         
     Example:
         >>> chart = create_filled_chart(
@@ -195,11 +190,11 @@ def create_filled_chart(
         "timestamp": datetime.now().isoformat()
     }
     
-    component = {
-        "type": "ChartComponent",
-        "id": chart_id,
-        "data": data
-    }
+    component = Component(
+        type="ChartComponent",
+        id=chart_id,
+        data=data
+    )
     
     if active_components is not None:
         track_component(chart_id, data, active_components)
@@ -322,21 +317,22 @@ async def _send_empty_charts(charts_data: list[dict], active_components: Dict[st
             chart_info["x_axis"],
             active_components
         )
-        yield format_component(empty_chart).encode("utf-8")
+        yield format_component(empty_chart)
         await asyncio.sleep(0.1)
 
 
 async def _send_chart_loading_text(num_charts: int, charts_data: list[dict]) -> AsyncGenerator[bytes, None]:
     """Send loading text while processing charts."""
-    yield "\n".encode("utf-8")
-    
     if num_charts == 1:
         loading_text = f"Generating {charts_data[0]['chart_type']} chart"
     else:
         loading_text = f"Generating all {num_charts} charts"
     
+    # The leading line break rides in the same chunk as the first word
+    prefix = "\n"
     for word in loading_text.split():
-        yield f"{word} ".encode("utf-8")
+        yield f"{prefix}{word} ".encode("utf-8")
+        prefix = ""
         await asyncio.sleep(STREAM_DELAY)
     
     if SIMULATE_PROCESSING_TIME:
@@ -361,7 +357,7 @@ async def _stream_chart_points(charts_data: list[dict], active_components: Dict[
                     chart_info["series_label"],
                     active_components
                 )
-                yield format_component(data_update).encode("utf-8")
+                yield format_component(data_update)
                 await asyncio.sleep(CHART_POINT_DELAY)
         
         # Stream progress text every few points
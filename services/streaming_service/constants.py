@@ -25,6 +25,7 @@ MAX_CHARTS_PER_RESPONSE = getattr(settings, "MAX_CHARTS_PER_RESPONSE", 3)
 
 # Streaming delays
 STREAM_DELAY = settings.STREAM_DELAY
+STREAM_COALESCE_WINDOW_MS = getattr(settings, "STREAM_COALESCE_WINDOW_MS", 1.0)
 COMPONENT_UPDATE_DELAY = settings.COMPONENT_UPDATE_DELAY
 TABLE_ROW_DELAY = getattr(settings, "TABLE_ROW_DELAY", 0.2)
 CHART_POINT_DELAY = getattr(settings, "CHART_POINT_DELAY", 0.2)
@@ -5,18 +5,48 @@ Provides common tracking, validation, and helper functions used across
 all streaming service modules.
 """
 
+import asyncio
 import json
 import logging
 import uuid
-from typing import Dict
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, Union
 from datetime import datetime
 
-from .constants import COMPONENT_DELIMITER, COMPONENT_TYPES
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .constants import COMPONENT_DELIMITER, COMPONENT_TYPES, STREAM_COALESCE_WINDOW_MS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("streaming")
 
+# Pre-encoded frame delimiter wrapped around every component on the wire
+_FRAME = COMPONENT_DELIMITER.encode("utf-8")
+
+# Coalescing buffer settings
+_COALESCE_QUEUE_SIZE = 16
+_STREAM_END = object()
+
+
+@dataclass(slots=True)
+class Component:
+    """
+    Compact wire representation of a streamed component.
+    
+    Built by the create_* helpers instead of a {"type", "id", "data"} dict;
+    slots keep it small and cheap to allocate. orjson serializes it natively
+    and format_component() handles it on the stdlib json fallback.
+    Tracked state in active_components is still the plain data dict.
+    """
+    type: str
+    id: str
+    data: dict
+
 
 def track_component(component_id: str, data: dict, active_components: Dict[str, dict]):
     """
@@ -113,15 +143,96 @@ def validate_component(component: dict) -> bool:
         return False
 
 
-def format_component(component: dict) -> str:
+def format_component(component: Union[dict, Component]) -> bytes:
     """
-    Format a component dictionary with delimiters for streaming.
+    Format a component with delimiters for streaming.
+    
+    Serializes straight to bytes (orjson when installed, compact stdlib json
+    otherwise) and wraps the body in the pre-encoded delimiter, so handlers
+    can yield the result without a str round-trip.
     
     Args:
-        component: Component dictionary to format
+        component: Component dictionary or Component instance to format
         
     Returns:
-        str: Formatted component string with delimiters
+        bytes: UTF-8 encoded component frame with delimiters
+    """
+    if ORJSON_AVAILABLE:
+        component_json = orjson.dumps(component)
+    else:
+        if isinstance(component, Component):
+            component = {"type": component.type, "id": component.id, "data": component.data}
+        component_json = json.dumps(component, separators=(',', ':')).encode("utf-8")
+    return _FRAME + component_json + _FRAME
+
+
+async def coalesce_chunks(
+    chunks: AsyncGenerator[bytes, None],
+    window_ms: float = STREAM_COALESCE_WINDOW_MS
+) -> AsyncGenerator[bytes, None]:
     """
-    component_json = json.dumps(component, separators=(',', ':'))
-    return f"{COMPONENT_DELIMITER}{component_json}{COMPONENT_DELIMITER}"
+    Merge chunks produced in quick succession into fewer, larger writes.
+    
+    The source generator runs as a separate task feeding a bounded queue.
+    Each flush waits for one chunk and takes everything already queued
+    without awaiting. Only when followers were queued (a burst) does it wait
+    window_ms once more for stragglers, so bursts of small yields (words,
+    dots, back-to-back components) become a single ASGI body event, while
+    lone chunks and the end of the stream flush with no added delay.
+    
+    Args:
+        chunks: Source stream of encoded chunks (e.g. generate_chunks());
+                closed when this generator finishes or the client disconnects
+        window_ms: Maximum time to hold a chunk waiting for followers
+        
+    Yields:
+        bytes: Coalesced chunks in original order
+    """
+    window = window_ms / 1000
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_COALESCE_QUEUE_SIZE)
+    
+    async def produce():
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            # Hand the error to the consumer so it surfaces after the flush
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        finished = False
+        while not finished:
+            item = await queue.get()
+            # Only a burst (followers already queued) waits for more
+            wait = window > 0 and not queue.empty()
+            
+            batch = []
+            while True:
+                if item is _STREAM_END:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    if batch:
+                        yield b"".join(batch)
+                    raise item
+                batch.append(item)
+                
+                if queue.empty():
+                    if not wait:
+                        break
+                    wait = False
+                    await asyncio.sleep(window)
+                    if queue.empty():
+                        break
+                item = queue.get_nowait()
+            
+            if batch:
+                yield b"".join(batch)
+    finally:
+        producer.cancel()
+        # The source can only be closed once the producer has stopped iterating it
+        await asyncio.wait([producer])
+        await chunks.aclose()
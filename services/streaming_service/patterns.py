@@ -197,13 +197,13 @@ async def generate_chunks(user_message: str) -> AsyncGenerator[bytes, None]:
             from services.llm import llm_planner_service
             from .core import format_component
 
-            # Generate layout using LLM
-            layout = await llm_planner_service.generate_layout(user_message)
-
-            # Stream components directly (no progressive loading for LLM mode)
-            for component in layout["components"]:
-                formatted = format_component(component)
-                yield formatted.encode("utf-8")
+            # Stream each component as soon as the LLM finishes planning it
+            # (no progressive loading for LLM mode)
+            layout = {}
+            async for component in llm_planner_service.generate_layout_stream(
+                user_message, on_complete=layout.update
+            ):
+                yield format_component(component)
                 await asyncio.sleep(0.1)  # Small delay between components
 
             # Log success
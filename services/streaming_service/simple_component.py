@@ -17,14 +17,29 @@ from datetime import datetime, timezone
 
 from utils.id_generator import generate_uuid7
 from schemas.component_schemas import ComponentData, SimpleComponentData
-from .core import track_component, get_component_state, format_component, logger
+from .core import Component, track_component, get_component_state, format_component, logger
 from .constants import (
-    STREAM_DELAY, COMPONENT_UPDATE_DELAY, 
+    STREAM_DELAY, COMPONENT_UPDATE_DELAY, COMPONENT_DELIMITER,
     SIMULATE_PROCESSING_TIME, MAX_COMPONENTS_PER_RESPONSE
 )
 
 
-def create_empty_component(component_id: str, active_components: Dict[str, dict]) -> dict:
+DELAYED_CARD_LOADING_DESCRIPTION = "Generating units... please wait."
+
+# Pre-rendered wire format for the initial delayed card (Phase 5.2 hot path).
+# Only the UUID, the card number (%d) and the ISO date are interpolated, none of
+# which need JSON escaping, so the dict build + json.dumps walk can be skipped.
+_DELAYED_CARD_TEMPLATE = (
+    COMPONENT_DELIMITER
+    + '{"type":"SimpleComponent","id":"%s","data":{"title":"Delayed Card #%d",'
+    + '"date":"%s","description":"' + DELAYED_CARD_LOADING_DESCRIPTION + '"}}'
+    + COMPONENT_DELIMITER
+)
+# Characters a generated UUID string can contain (safe inside the JSON template)
+_UUID_CHARS = frozenset("0123456789abcdef-")
+
+
+def create_empty_component(component_id: str, active_components: Dict[str, dict]) -> Component:
     """
     Create empty component placeholder (Phase 2).
     
@@ -36,22 +51,20 @@ def create_empty_component(component_id: str, active_components: Dict[str, dict]
         active_components: Request-scoped component tracking dictionary
         
     Returns:
-        dict: Empty component structure
+        Component: Empty component structure
         
     Example:
         >>> comp = create_empty_component("abc-123", {})
-        >>> print(comp)
-        {
-            "type": "SimpleComponent",
-            "id": "abc-123",
-            "data": {}
-        }
+        >>> comp
+        Component(type='SimpleComponent', id='abc-123', data={})
+        >>> format_component(comp)
+        b'$$${"type":"SimpleComponent","id":"abc-123","data":{}}$$$'
     """
-    component = {
-        "type": "SimpleComponent",
-        "id": component_id,
-        "data": {}
-    }
+    component = Component(
+        type="SimpleComponent",
+        id=component_id,
+        data={}
+    )
     
     track_component(component_id, {}, active_components)
     logger.info(f"Created empty component: {component_id}")
@@ -64,8 +77,9 @@ def create_filled_component(
     title: str,
     description: str,
     value: int,
-    active_components: Dict[str, dict]
-) -> dict:
+    active_components: Dict[str, dict],
+    track: bool = True
+) -> Component:
     """
     Create component with full data (Phase 2).
     
@@ -78,23 +92,18 @@ def create_filled_component(
         description: Component description
         value: Numeric value
         active_components: Request-scoped component tracking dictionary
+        track: Record the final state in active_components. Terminal updates
+            whose state is never read back can pass False to skip the write.
         
     Returns:
-        dict: Filled component structure
+        Component: Filled component structure
         
     Example:
         >>> comp = create_filled_component("abc-123", "Card", "Data loaded", 100, {})
-        >>> print(comp)
-        {
-            "type": "SimpleComponent",
-            "id": "abc-123",
-            "data": {
-                "title": "Card",
-                "description": "Data loaded",
-                "value": 100,
-                "timestamp": "2025-10-14T13:30:00.123456"
-            }
-        }
+        >>> comp
+        Component(type='SimpleComponent', id='abc-123', data={'title': 'Card',
+                  'description': 'Data loaded', 'value': 100,
+                  'timestamp': '2025-10-14T13:30:00.123456'})
     """
     data = {
         "title": title,
@@ -103,19 +112,20 @@ def create_filled_component(
         "timestamp": datetime.now().isoformat()
     }
     
-    component = {
-        "type": "SimpleComponent",
-        "id": component_id,
-        "data": data
-    }
+    component = Component(
+        type="SimpleComponent",
+        id=component_id,
+        data=data
+    )
     
-    track_component(component_id, data, active_components)
+    if track:
+        track_component(component_id, data, active_components)
     logger.info(f"Filled component: {component_id} with data: {data}")
     
     return component
 
 
-def create_partial_update(component_id: str, data: dict, active_components: Dict[str, dict]) -> dict:
+def create_partial_update(component_id: str, data: dict, active_components: Dict[str, dict]) -> Component:
     """
     Create partial data update for existing component (Phase 2).
     
@@ -127,22 +137,20 @@ def create_partial_update(component_id: str, data: dict, active_components: Dict
         active_components: Request-scoped component tracking dictionary
         
     Returns:
-        dict: Component update structure
+        Component: Component update structure
         
     Example:
         >>> update = create_partial_update("abc-123", {"title": "Loading..."}, {})
-        >>> print(update)
-        {
-            "type": "SimpleComponent",
-            "id": "abc-123",
-            "data": {"title": "Loading..."}
-        }
+        >>> update
+        Component(type='SimpleComponent', id='abc-123', data={'title': 'Loading...'})
+        >>> format_component(update)
+        b'$$${"type":"SimpleComponent","id":"abc-123","data":{"title":"Loading..."}}$$$'
     """
-    component = {
-        "type": "SimpleComponent",
-        "id": component_id,
-        "data": data
-    }
+    component = Component(
+        type="SimpleComponent",
+        id=component_id,
+        data=data
+    )
     
     # Merge with existing state
     existing_data = get_component_state(component_id, active_components)
@@ -234,8 +242,8 @@ async def generate_card_with_delay(active_components: Dict[str, dict]) -> AsyncG
     }
     
     track_component(component_id, initial_data, active_components)
-    yield format_component(initial_component).encode("utf-8")
-    await asyncio.sleep(0.1)
+    yield format_component(initial_component)
+    await asyncio.sleep(0)  # Yield to the event loop so the frame flushes
     
     logger.info(f"Sent initial component with title+date+description: {component_id}")
     
@@ -259,7 +267,7 @@ async def generate_card_with_delay(active_components: Dict[str, dict]) -> AsyncG
     merged_data = {**existing_data, **partial_update["data"]}
     track_component(component_id, merged_data, active_components)
     
-    yield format_component(partial_update).encode("utf-8")
+    yield format_component(partial_update)
     await asyncio.sleep(0.1)
     
     logger.info(f"Sent partial update (description+units) for component: {component_id}")
@@ -281,7 +289,7 @@ async def handle_single_card(active_components: Dict[str, dict]) -> AsyncGenerat
     # Stage 1: Send empty component (creates placeholder)
     component_id = generate_uuid7()
     empty_component = create_empty_component(component_id, active_components)
-    yield format_component(empty_component).encode("utf-8")
+    yield format_component(empty_component)
     await asyncio.sleep(STREAM_DELAY)
     
     # Stage 2: Stream text while "processing"
@@ -296,17 +304,16 @@ async def handle_single_card(active_components: Dict[str, dict]) -> AsyncGenerat
             yield ".".encode("utf-8")
             await asyncio.sleep(0.3)
     
-    yield " ".encode("utf-8")
-    
-    # Stage 3: Send component with full data
+    # Stage 3: Send component with full data (separator rides in the same chunk)
     filled_component = create_filled_component(
         component_id,
         title="Dynamic Card",
         description="Data loaded successfully from the backend",
         value=150,
-        active_components=active_components
+        active_components=active_components,
+        track=False  # Terminal update, state is never read back
     )
-    yield format_component(filled_component).encode("utf-8")
+    yield b" " + format_component(filled_component)
     await asyncio.sleep(STREAM_DELAY)
     
     # Stage 4: Completion message
@@ -331,27 +338,25 @@ async def handle_delayed_cards(num_cards: int, active_components: Dict[str, dict
     # Limit to max
     num_cards = min(num_cards, MAX_COMPONENTS_PER_RESPONSE)
     
+    # Pre-mint all IDs up front so the paced loop below only formats and yields
+    card_ids = [generate_uuid7() for _ in range(num_cards)]
+    
     # Stage 1: Send all cards with initial data (title + date + description "loading...")
-    cards = []
-    for i in range(num_cards):
-        cid = generate_uuid7()
-        cards.append(cid)
+    for i, cid in enumerate(card_ids):
+        date = datetime.now().isoformat()
         
+        # Tracked state is still needed for the Stage 3 merge
         initial_data = {
             "title": f"Delayed Card #{i+1}",
-            "date": datetime.now().isoformat(),
-            "description": "Generating units... please wait."
-        }
-        
-        initial_component = {
-            "type": "SimpleComponent",
-            "id": cid,
-            "data": initial_data
+            "date": date,
+            "description": DELAYED_CARD_LOADING_DESCRIPTION
         }
         
         track_component(cid, initial_data, active_components)
-        yield format_component(initial_component).encode("utf-8")
-        await asyncio.sleep(0.05)  # Quick succession
+        # The template is not JSON-escaped: only a card number and a plain UUID may go in
+        assert isinstance(i, int) and len(cid) == 36 and _UUID_CHARS.issuperset(cid), cid
+        yield (_DELAYED_CARD_TEMPLATE % (cid, i + 1, date)).encode("utf-8")
+        await asyncio.sleep(0)  # Quick succession: yield to the event loop only
         
         logger.info(f"Sent initial delayed card with title+date+description: {cid}")
     
@@ -366,11 +371,12 @@ async def handle_delayed_cards(num_cards: int, active_components: Dict[str, dict
     else:
         await asyncio.sleep(delay_seconds)
     
-    yield "\n".encode("utf-8")
     logger.info(f"Delay completed for all {num_cards} cards")
     
     # Stage 3: Send partial updates with units for all cards (interleaved)
-    for idx, cid in enumerate(cards):
+    # The line break closing Stage 2 rides in the same chunk as the first update
+    prefix = b"\n"
+    for idx, cid in enumerate(card_ids):
         partial_update = {
             "type": "SimpleComponent",
             "id": cid,
@@ -385,8 +391,9 @@ async def handle_delayed_cards(num_cards: int, active_components: Dict[str, dict
         merged_data = {**existing_data, **partial_update["data"]}
         track_component(cid, merged_data, active_components)
         
-        yield format_component(partial_update).encode("utf-8")
-        await asyncio.sleep(0.1)
+        yield prefix + format_component(partial_update)
+        prefix = b""
+        await asyncio.sleep(0)  # Quick succession: yield to the event loop only
         
         logger.info(f"Sent partial update (description+units) for card: {cid}")
     
@@ -412,15 +419,14 @@ async def handle_normal_cards(num_components: int, active_components: Dict[str,
     # Limit to max
     num_components = min(num_components, MAX_COMPONENTS_PER_RESPONSE)
     
+    # Pre-mint all IDs up front so the paced loop below only formats and yields
+    component_ids = [generate_uuid7() for _ in range(num_components)]
+    
     # Stage 1: Send all empty components first
-    component_ids = []
-    for i in range(num_components):
-        comp_id = generate_uuid7()
-        component_ids.append(comp_id)
-        
+    for comp_id in component_ids:
         empty = create_empty_component(comp_id, active_components)
-        yield format_component(empty).encode("utf-8")
-        await asyncio.sleep(0.1)  # Quick succession
+        yield format_component(empty)
+        await asyncio.sleep(0)  # Quick succession: yield to the event loop only
     
     # Stage 2: Stream text while "loading"
     loading_text = f"Loading data for all {num_components} cards"
@@ -434,18 +440,20 @@ async def handle_normal_cards(num_components: int, active_components: Dict[str,
             yield ".".encode("utf-8")
             await asyncio.sleep(0.3)
     
-    yield " ".encode("utf-8")
-    
     # Stage 3: Update each component with data (staggered)
+    # The separator space rides in the same chunk as the first update
+    prefix = b" "
     for i, comp_id in enumerate(component_ids):
         filled = create_filled_component(
             comp_id,
             title=f"Card {i+1}",
             description=f"This is card number {i+1} with unique data",
             value=(i+1) * 100,
-            active_components=active_components
+            active_components=active_components,
+            track=False  # Terminal update, state is never read back
         )
-        yield format_component(filled).encode("utf-8")
+        yield prefix + format_component(filled)
+        prefix = b""
         await asyncio.sleep(COMPONENT_UPDATE_DELAY)
     
     # Stage 4: Completion
@@ -470,7 +478,7 @@ async def handle_incremental_loading(active_components: Dict[str, dict]) -> Asyn
     
     # Stage 1: Empty component
     empty = create_empty_component(component_id, active_components)
-    yield format_component(empty).encode("utf-8")
+    yield format_component(empty)
     await asyncio.sleep(0.2)
     
     yield "Watch the card load incrementally... ".encode("utf-8")
@@ -478,7 +486,7 @@ async def handle_incremental_loading(active_components: Dict[str, dict]) -> Asyn
     
     # Stage 2: Update with title only
     partial1 = create_partial_update(component_id, {"title": "Loading..."}, active_components)
-    yield format_component(partial1).encode("utf-8")
+    yield format_component(partial1)
     await asyncio.sleep(0.5)
     
     # Stage 3: Update with title + description
@@ -486,7 +494,7 @@ async def handle_incremental_loading(active_components: Dict[str, dict]) -> Asyn
         "title": "Progressive Card",
         "description": "Description loaded..."
     }, active_components)
-    yield format_component(partial2).encode("utf-8")
+    yield format_component(partial2)
     await asyncio.sleep(0.5)
     
     # Stage 4: Complete data
@@ -497,7 +505,7 @@ async def handle_incremental_loading(active_components: Dict[str, dict]) -> Asyn
         value=100,
         active_components=active_components
     )
-    yield format_component(filled).encode("utf-8")
+    yield format_component(filled)
     await asyncio.sleep(0.2)
     
     yield " Done with incremental loading!".encode("utf-8")
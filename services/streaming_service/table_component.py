@@ -14,14 +14,14 @@ from typing import AsyncGenerator, Dict
 from datetime import datetime
 
 from utils.id_generator import generate_uuid7
-from .core import track_component, get_component_state, format_component, logger
+from .core import Component, track_component, get_component_state, format_component, logger
 from .constants import (
     STREAM_DELAY, TABLE_ROW_DELAY, SIMULATE_PROCESSING_TIME,
     MAX_TABLES_PER_RESPONSE, MAX_TABLE_ROWS, TABLE_COLUMNS_PRESET
 )
 
 
-def create_empty_table(table_id: str, columns: list[str], active_components: Dict[str, dict]) -> dict:
+def create_empty_table(table_id: str, columns: list[str], active_components: Dict[str, dict]) -> Component:
     """
     Create empty table placeholder with columns only (Phase 3).
     
@@ -34,28 +34,22 @@ def create_empty_table(table_id: str, columns: list[str], active_components: Dic
         active_components: Request-scoped component tracking dictionary
         
     Returns:
-        dict: Empty TableA component structure
+        Component: Empty TableA component structure
         
     Example:
         >>> table = create_empty_table("table-1", ["Name", "Sales", "Region"], {})
-        >>> print(table)
-        {
-            "type": "TableA",
-            "id": "table-1",
-            "data": {
-                "columns": ["Name", "Sales", "Region"],
-                "rows": []
-            }
-        }
+        >>> table
+        Component(type='TableA', id='table-1',
+                  data={'columns': ['Name', 'Sales', 'Region'], 'rows': []})
     """
-    component = {
-        "type": "TableA",
-        "id": table_id,
-        "data": {
+    component = Component(
+        type="TableA",
+        id=table_id,
+        data={
             "columns": columns,
             "rows": []
         }
-    }
+    )
     
     track_component(table_id, {"columns": columns, "rows": []}, active_components)
     logger.info(f"Created empty table: {table_id} with columns: {columns}")
@@ -63,7 +57,7 @@ def create_empty_table(table_id: str, columns: list[str], active_components: Dic
     return component
 
 
-def create_table_row_update(table_id: str, new_rows: list[list], active_components: Dict[str, dict]) -> dict:
+def create_table_row_update(table_id: str, new_rows: list[list], active_components: Dict[str, dict]) -> Component:
     """
     Create a row update for an existing table (Phase 3).
     
@@ -76,18 +70,13 @@ def create_table_row_update(table_id: str, new_rows: list[list], active_componen
         active_components: Request-scoped component tracking dictionary
         
     Returns:
-        dict: TableA update structure with new rows
+        Component: TableA update structure with new rows
         
     Example:
         >>> update = create_table_row_update("table-1", [["Alice", 123, "US"]], {})
-        >>> print(update)
-        {
-            "type": "TableA",
-            "id": "table-1",
-            "data": {
-                "rows": [["Alice", 123, "US"]]
-            }
-        }
+        >>> update
+        Component(type='TableA', id='table-1',
+                  data={'columns': [], 'rows': [['Alice', 123, 'US']]})
     """
     # Merge with existing state
     existing_data = get_component_state(table_id, active_components)
@@ -104,14 +93,14 @@ def create_table_row_update(table_id: str, new_rows: list[list], active_componen
     logger.info(f"Added {len(new_rows)} row(s) to table {table_id}. Total rows: {len(merged_rows)}")
     
     # Include columns in the update so tests can identify table type
-    component = {
-        "type": "TableA",
-        "id": table_id,
-        "data": {
+    component = Component(
+        type="TableA",
+        id=table_id,
+        data={
             "columns": existing_columns,
             "rows": new_rows
         }
-    }
+    )
     
     return component
 
@@ -122,7 +111,7 @@ def create_filled_table(
     rows: list[list],
     total_rows: int = None,
     active_components: Dict[str, dict] = None
-) -> dict:
+) -> Component:
     """
     Create complete table with all data (Phase 3).
     
@@ -137,7 +126,7 @@ def create_filled_table(
         active_components: Request-scoped component tracking dictionary (optional for backwards compatibility)
         
     Returns:
-        dict: Complete TableA component structure
+        Component: Complete TableA component structure
         
     Example:
         >>> table = create_filled_table(
@@ -156,11 +145,11 @@ def create_filled_table(
     if total_rows is not None:
         data["total_rows"] = total_rows
     
-    component = {
-        "type": "TableA",
-        "id": table_id,
-        "data": data
-    }
+    component = Component(
+        type="TableA",
+        id=table_id,
+        data=data
+    )
     
     if active_components is not None:
         track_component(table_id, data, active_components)
@@ -240,14 +229,14 @@ def _resolve_table_types(num_tables: int, detected_types: list[str]) -> list[str
     
     if num_tables > len(detected_types):
         # Fill with mixed types
-        all_types = ["sales", "users", "products"]
-        result = detected_types.copy()
+        all_types = ("sales", "users", "products")
+        result = list(detected_types)
         for table_type in all_types:
+            if len(result) >= num_tables:
+                break
             if table_type not in result:
                 result.append(table_type)
-                if len(result) >= num_tables:
-                    break
-        return result[:num_tables]
+        return result
     
     return detected_types[:num_tables]
 
@@ -272,20 +261,22 @@ async def _send_empty_tables(tables_data: list[dict], active_components: Dict[st
     """Send empty table skeletons."""
     for table_info in tables_data:
         empty_table = create_empty_table(table_info["id"], table_info["columns"], active_components)
-        yield format_component(empty_table).encode("utf-8")
-        await asyncio.sleep(0.1)
+        yield format_component(empty_table)
+        await asyncio.sleep(0)  # Quick succession: yield to the event loop only
 
 
 async def _send_loading_text(num_tables: int, table_types: list[str]) -> AsyncGenerator[bytes, None]:
     """Send loading text while processing."""
-    yield "\n".encode("utf-8")
     if num_tables == 1:
         loading_text = f"Here's your {table_types[0]} table. Loading data"
     else:
         loading_text = f"Loading data for all {num_tables} tables"
     
+    # The leading line break rides in the same chunk as the first word
+    prefix = "\n"
     for word in loading_text.split():
-        yield f"{word} ".encode("utf-8")
+        yield f"{prefix}{word} ".encode("utf-8")
+        prefix = ""
         await asyncio.sleep(STREAM_DELAY)
     
     if SIMULATE_PROCESSING_TIME:
@@ -305,7 +296,7 @@ async def _stream_table_rows(tables_data: list[dict], active_components: Dict[st
             if row_idx < len(table_info["rows"]):
                 row = table_info["rows"][row_idx]
                 row_update = create_table_row_update(table_info["id"], [row], active_components)
-                yield format_component(row_update).encode("utf-8")
+                yield format_component(row_update)
                 await asyncio.sleep(TABLE_ROW_DELAY)
         
         # Stream progress text every few rounds
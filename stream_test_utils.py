@@ -0,0 +1,90 @@
+"""
+Shared helpers for the streaming test scripts (test_phase3.py, test_phase4.py).
+
+Holds the HTTP transport tuning used by every script's requests.Session and
+the coalescing writer and GC pause that keep the terminal streaming loop cheap.
+"""
+
+import gc
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import BinaryIO, Optional
+
+from requests.adapters import HTTPAdapter
+
+# Disable Nagle so small request bodies go out at once, and use a 4 MB
+# receive buffer for large streamed responses
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024),
+]
+# Terminal refresh interval for streamed output (~60 Hz)
+FLUSH_INTERVAL = 0.016
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter that applies SOCKET_OPTIONS to every pooled connection."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+class FlushCoalescer:
+    """
+    Batch streamed bytes into at most one terminal write per FLUSH_INTERVAL.
+    
+    Pending bytes go out with the first chunk after the interval has elapsed,
+    or on an explicit flush() when the stream ends.
+    """
+    
+    def __init__(self, sink: BinaryIO, interval: float = FLUSH_INTERVAL):
+        self._sink = sink
+        self._interval = interval
+        self._pending = bytearray()
+        self._last_flush = time.monotonic()
+    
+    def write(self, chunk: bytes):
+        self._pending += chunk
+        now = time.monotonic()
+        if now - self._last_flush >= self._interval:
+            self.flush(now)
+    
+    def flush(self, now: Optional[float] = None):
+        if self._pending:
+            self._sink.write(self._pending)
+            self._sink.flush()
+            self._pending.clear()
+        self._last_flush = time.monotonic() if now is None else now
+
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = True
+
+
+@contextmanager
+def gc_paused():
+    """
+    Keep the cyclic GC out of a hot streaming loop, collecting once afterwards.
+    
+    Concurrent streams share one pause: the GC is disabled by the first caller
+    and restored (after a single collect) when the last one finishes.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0:
+                gc.collect()
+                if _gc_was_enabled:
+                    gc.enable()
@@ -16,198 +16,251 @@ Test scenarios:
 Backend must be running on http://127.0.0.1:8001
 """
 
+import io
+import json
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, TextIO
+from stream_test_utils import FlushCoalescer, SocketOptionsAdapter, gc_paused
 
+# orjson serializes request bodies straight to bytes; stdlib json is the fallback
+try:
+    from orjson import dumps as _jdumps
+except ImportError:
+    def _jdumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
-def print_separator():
+# Ask for gzip explicitly; requests/urllib3 decompress transparently while streaming
+REQUEST_HEADERS = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
+
+# Separators and banners, built once
+SEP = "-" * 80
+DSEP = "=" * 80
+BANNER_PHASE3 = (
+    "╔═══════════════════════════════════════════════════════════════════════════════╗\n"
+    "║                     PHASE 3 TEST SUITE - TableA Component                    ║\n"
+    "╚═══════════════════════════════════════════════════════════════════════════════╝\n"
+)
+BANNER_SUMMARY = (
+    "╔═══════════════════════════════════════════════════════════════════════════════╗\n"
+    "║                              TEST SUMMARY                                     ║\n"
+    "╚═══════════════════════════════════════════════════════════════════════════════╝\n"
+)
+
+
+# Shared keep-alive session: every test reuses one pooled connection
+SESSION = requests.Session()
+SESSION.mount("http://", SocketOptionsAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+
+def print_separator(out: Optional[TextIO] = None):
     """Print a visual separator between tests."""
-    print("\n" + "=" * 80 + "\n")
+    print("\n" + DSEP + "\n", file=out)
+
+
+def _stream_to_stdout(message: str, out: TextIO):
+    """
+    POST a chat message and echo the raw stream to ``out`` as it arrives.
+    
+    Args:
+        message: Message to send to the chat endpoint
+        out: Text stream with a binary ``buffer`` to write to
+        
+    Raises:
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    with SESSION.post(
+        "http://127.0.0.1:8001/chat",
+        data=_jdumps({"message": message}),
+        headers=REQUEST_HEADERS,
+        stream=True,
+        timeout=30
+    ) as response:
+        if not response.ok:
+            # Read the error body to EOF so the keep-alive connection is reusable
+            response.raw.drain_conn()
+        response.raise_for_status()
+        
+        # Raw bytes go straight to the binary buffer, skipping text re-encoding;
+        # chunk_size=None yields each socket read as it arrives rather than
+        # the 1-byte default, so the loop runs once per streamed chunk
+        display = FlushCoalescer(out.buffer)
+        with gc_paused():
+            try:
+                for chunk in response.iter_content(chunk_size=None, decode_unicode=False):
+                    if chunk:
+                        display.write(chunk)
+            finally:
+                display.flush()
 
 
-def test_single_table(table_type="sales"):
+def test_single_table(table_type="sales", out: Optional[TextIO] = None):
     """
     Test single table rendering with progressive rows.
     
     Args:
         table_type: Type of table to request ("sales", "users", or "products")
+        out: Text stream with a binary ``buffer`` to write to (defaults to stdout)
     """
-    print(f"🧪 Test: Single {table_type.upper()} Table")
-    print("-" * 80)
-    
+    out = out or sys.stdout
     prompt = f"show me {table_type} table"
-    print(f"Prompt: '{prompt}'")
-    print("\nExpected behavior:")
-    print("  1. Empty table with columns appears")
-    print("  2. Loading text streams")
-    print("  3. Rows appear one by one")
-    print("  4. Completion message")
-    print("\nActual stream:")
-    print("-" * 80)
+    out.write(
+        f"🧪 Test: Single {table_type.upper()} Table\n{SEP}\n"
+        f"Prompt: '{prompt}'\n"
+        "\nExpected behavior:\n"
+        "  1. Empty table with columns appears\n"
+        "  2. Loading text streams\n"
+        "  3. Rows appear one by one\n"
+        "  4. Completion message\n"
+        f"\nActual stream:\n{SEP}\n"
+    )
+    out.flush()
     
     try:
-        response = requests.post(
-            "http://127.0.0.1:8001/chat",
-            json={"message": prompt},
-            stream=True,
-            timeout=30
-        )
-        
-        response.raise_for_status()
+        _stream_to_stdout(prompt, out)
         
-        for chunk in response.iter_content(decode_unicode=True):
-            if chunk:
-                print(chunk, end='', flush=True)
-        
-        print("\n" + "-" * 80)
-        print("✅ Test completed successfully!")
+        out.write(f"\n{SEP}\n✅ Test completed successfully!\n")
         
     except requests.exceptions.RequestException as e:
-        print(f"\n❌ Test failed with error: {e}")
+        print(f"\n❌ Test failed with error: {e}", file=out)
         return False
     
     return True
 
 
-def test_mixed_content():
+def test_mixed_content(out: Optional[TextIO] = None):
     """Test table mixed with regular text."""
-    print("🧪 Test: Mixed Content (Text + Table)")
-    print("-" * 80)
-    
+    out = out or sys.stdout
     prompt = "Can you show me a sales table please?"
-    print(f"Prompt: '{prompt}'")
-    print("\nExpected behavior:")
-    print("  1. Table renders with progressive rows")
-    print("  2. All text streams normally")
-    print("\nActual stream:")
-    print("-" * 80)
+    out.write(
+        f"🧪 Test: Mixed Content (Text + Table)\n{SEP}\n"
+        f"Prompt: '{prompt}'\n"
+        "\nExpected behavior:\n"
+        "  1. Table renders with progressive rows\n"
+        "  2. All text streams normally\n"
+        f"\nActual stream:\n{SEP}\n"
+    )
+    out.flush()
     
     try:
-        response = requests.post(
-            "http://127.0.0.1:8001/chat",
-            json={"message": prompt},
-            stream=True,
-            timeout=30
-        )
+        _stream_to_stdout(prompt, out)
         
-        response.raise_for_status()
-        
-        for chunk in response.iter_content(decode_unicode=True):
-            if chunk:
-                print(chunk, end='', flush=True)
-        
-        print("\n" + "-" * 80)
-        print("✅ Test completed successfully!")
+        out.write(f"\n{SEP}\n✅ Test completed successfully!\n")
         
     except requests.exceptions.RequestException as e:
-        print(f"\n❌ Test failed with error: {e}")
+        print(f"\n❌ Test failed with error: {e}", file=out)
         return False
     
     return True
 
 
-def test_backwards_compatibility():
+def test_backwards_compatibility(out: Optional[TextIO] = None):
     """Test that Phase 2 SimpleComponent still works."""
-    print("🧪 Test: Backwards Compatibility (Phase 2 SimpleComponent)")
-    print("-" * 80)
-    
+    out = out or sys.stdout
     prompt = "show me a card"
-    print(f"Prompt: '{prompt}'")
-    print("\nExpected behavior:")
-    print("  1. Empty SimpleComponent appears")
-    print("  2. Loading text streams")
-    print("  3. Component updates with data")
-    print("\nActual stream:")
-    print("-" * 80)
+    out.write(
+        f"🧪 Test: Backwards Compatibility (Phase 2 SimpleComponent)\n{SEP}\n"
+        f"Prompt: '{prompt}'\n"
+        "\nExpected behavior:\n"
+        "  1. Empty SimpleComponent appears\n"
+        "  2. Loading text streams\n"
+        "  3. Component updates with data\n"
+        f"\nActual stream:\n{SEP}\n"
+    )
+    out.flush()
     
     try:
-        response = requests.post(
-            "http://127.0.0.1:8001/chat",
-            json={"message": prompt},
-            stream=True,
-            timeout=30
-        )
-        
-        response.raise_for_status()
-        
-        for chunk in response.iter_content(decode_unicode=True):
-            if chunk:
-                print(chunk, end='', flush=True)
+        _stream_to_stdout(prompt, out)
         
-        print("\n" + "-" * 80)
-        print("✅ Test completed successfully!")
+        out.write(f"\n{SEP}\n✅ Test completed successfully!\n")
         
     except requests.exceptions.RequestException as e:
-        print(f"\n❌ Test failed with error: {e}")
+        print(f"\n❌ Test failed with error: {e}", file=out)
         return False
     
     return True
 
 
+MAX_CONCURRENT_TESTS = 4
+
+
+def _capture_test(test_fn, *args):
+    """Run one test with its output captured so concurrent runs don't interleave."""
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    result = test_fn(*args, out=out)
+    print_separator(out)
+    out.flush()
+    return result, raw.getvalue()
+
+
 def run_all_tests():
     """Run all Phase 3 test scenarios."""
-    print("╔═══════════════════════════════════════════════════════════════════════════════╗")
-    print("║                     PHASE 3 TEST SUITE - TableA Component                    ║")
-    print("╚═══════════════════════════════════════════════════════════════════════════════╝")
-    print()
-    
-    # Check backend connectivity
     try:
-        requests.get("http://127.0.0.1:8001/", timeout=5)
-        print("✅ Backend is running and accessible")
-    except requests.exceptions.RequestException:
-        print("❌ Backend is not accessible at http://127.0.0.1:8001")
-        print("   Please start the backend first: python main.py")
-        sys.exit(1)
-    
-    print_separator()
-    
-    # Track test results
-    results = []
-    
-    # Test 1: Sales table
-    results.append(("Sales Table", test_single_table("sales")))
-    print_separator()
-    
-    # Test 2: Users table
-    results.append(("Users Table", test_single_table("users")))
-    print_separator()
-    
-    # Test 3: Products table
-    results.append(("Products Table", test_single_table("products")))
-    print_separator()
-    
-    # Test 4: Mixed content
-    results.append(("Mixed Content", test_mixed_content()))
-    print_separator()
-    
-    # Test 5: Backwards compatibility
-    results.append(("Backwards Compatibility", test_backwards_compatibility()))
-    print_separator()
-    
-    # Print summary
-    print("╔═══════════════════════════════════════════════════════════════════════════════╗")
-    print("║                              TEST SUMMARY                                     ║")
-    print("╚═══════════════════════════════════════════════════════════════════════════════╝")
-    print()
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✅ PASSED" if result else "❌ FAILED"
-        print(f"  {status:12} - {test_name}")
-    
-    print()
-    print(f"  Total: {passed}/{total} tests passed")
-    print()
-    
-    if passed == total:
-        print("  🎉 All tests passed! Phase 3 is working correctly.")
-        return 0
-    else:
-        print(f"  ⚠️  {total - passed} test(s) failed. Please review the output above.")
-        return 1
+        sys.stdout.write(BANNER_PHASE3 + "\n")
+        
+        # Check backend connectivity
+        try:
+            # The tiny /health body warms the pooled connection the tests reuse
+            response = SESSION.get("http://127.0.0.1:8001/health", timeout=5)
+            response.raise_for_status()
+            version = response.raw.version
+            print(f"✅ Backend is running and accessible (HTTP/{version // 10}.{version % 10})")
+        except requests.exceptions.RequestException:
+            print("❌ Backend is not accessible at http://127.0.0.1:8001")
+            print("   Please start the backend first: python main.py")
+            sys.exit(1)
+        
+        print_separator()
+        sys.stdout.flush()
+        
+        # Each test is an independent stream, so run them concurrently over the
+        # pooled session; each report is captured and printed whole on completion
+        cases = [
+            ("Sales Table", test_single_table, ("sales",)),
+            ("Users Table", test_single_table, ("users",)),
+            ("Products Table", test_single_table, ("products",)),
+            ("Mixed Content", test_mixed_content, ()),
+            ("Backwards Compatibility", test_backwards_compatibility, ()),
+        ]
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TESTS) as executor:
+            futures = {
+                executor.submit(_capture_test, fn, *args): name
+                for name, fn, args in cases
+            }
+            for future in as_completed(futures):
+                result, report = future.result()
+                outcomes[futures[future]] = result
+                sys.stdout.buffer.write(report)
+                sys.stdout.buffer.flush()
+        
+        # Summarize in the original test order
+        results = [(name, outcomes[name]) for name, _, _ in cases]
+        
+        # Print summary
+        sys.stdout.write(BANNER_SUMMARY + "\n")
+        
+        passed = sum(1 for _, result in results if result)
+        total = len(results)
+        
+        for test_name, result in results:
+            status = "✅ PASSED" if result else "❌ FAILED"
+            print(f"  {status:12} - {test_name}")
+        
+        print()
+        print(f"  Total: {passed}/{total} tests passed")
+        print()
+        
+        if passed == total:
+            print("  🎉 All tests passed! Phase 3 is working correctly.")
+            return 0
+        else:
+            print(f"  ⚠️  {total - passed} test(s) failed. Please review the output above.")
+            return 1
+    finally:
+        SESSION.close()
 
 
 if __name__ == "__main__":
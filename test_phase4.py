@@ -12,6 +12,7 @@ data point streaming. It validates:
 
 Run this script to verify Phase 4 implementation:
     python test_phase4.py
+    python test_phase4.py --async   # one event loop, requires httpx
 
 Expected Behavior:
 - ChartComponent streams progressively: empty → data points → complete
@@ -24,46 +25,168 @@ Date: October 15, 2025
 Version: 0.4.0
 """
 
+import asyncio
+import importlib.util
 import requests
+import io
 import json
-import re
+import queue
 import sys
-from typing import List, Dict, Union, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Union, Any, Optional, TextIO, BinaryIO
+from stream_test_utils import FlushCoalescer, SocketOptionsAdapter, gc_paused
+
+# httpx is optional: it only backs the --async runner
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 in httpx needs the h2 package
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# orjson parses component payloads much faster; stdlib json is the fallback.
+# Both accept str or bytes, and orjson.JSONDecodeError subclasses json's.
+try:
+    from orjson import dumps as _jdumps, loads as _jloads
+except ImportError:
+    _jloads = json.loads
+    
+    def _jdumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
 # Configuration
 API_URL = "http://127.0.0.1:8001/chat"
 DELIMITER = "$$$"
+DELIMITER_BYTES = DELIMITER.encode("utf-8")
 
+# Ask for gzip explicitly; requests/urllib3 decompress transparently while streaming
+REQUEST_HEADERS = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
+# Chunks buffered between the socket reader and the terminal writer thread
+WRITER_QUEUE_SIZE = 64
 
-def extract_components(response_text: str) -> List[Dict[str, Any]]:
+
+class BackgroundWriter:
+    """
+    Hand streamed chunks to a writer thread so terminal I/O never stalls socket reads.
+    
+    The thread coalesces writes through FlushCoalescer; close() signals end of
+    stream, waits for the thread, and leaves everything flushed.
     """
-    Extract all component JSON objects from streaming response.
+    
+    def __init__(self, sink: BinaryIO, maxsize: int = WRITER_QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize)
+        self._display = FlushCoalescer(sink)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def write(self, chunk: bytes):
+        self._queue.put(chunk)
+    
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _run(self):
+        try:
+            for chunk in iter(self._queue.get, None):
+                self._display.write(chunk)
+        finally:
+            self._display.flush()
+
+
+# Separators and banners, built once
+SEP = "-" * 80
+DSEP = "=" * 80
+BANNER_PHASE4 = (
+    f"{DSEP}\n"
+    "PHASE 4 TEST SUITE - Chart Component Progressive Streaming\n"
+    f"{DSEP}\n"
+    "Testing ChartComponent implementation with 5 scenarios:\n"
+    "1. Line Chart - Progressive Data\n"
+    "2. Bar Chart - Progressive Data\n"
+    "3. Mixed Content - Text + Chart\n"
+    "4. Multiple Charts - Line and Bar\n"
+    "5. Backward Compatibility - Phase 1-3 Components\n"
+    f"{DSEP}\n"
+)
+BANNER_COMPLETE = (
+    f"\n{DSEP}\n"
+    "ALL PHASE 4 TESTS COMPLETED\n"
+    f"{DSEP}\n"
+    "\n✅ Phase 4 Implementation Verified!\n"
+    "\nNext Steps:\n"
+    "1. Implement frontend ChartComponent renderer\n"
+    "2. Add chart merge logic to frontend state\n"
+    "3. Create smooth progressive animations for charts\n"
+    "4. Test with real-time data updates\n"
+    f"\n{DSEP}\n"
+)
+
+# Shared keep-alive session: every scenario reuses one pooled connection
+SESSION = requests.Session()
+SESSION.mount("http://", SocketOptionsAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+
+# Data keys merged incrementally rather than overwritten
+_SKIP = frozenset(("series", "rows"))
+
+
+def drain_components(buf: bytearray, out: Optional[TextIO] = None) -> List[Dict[str, Any]]:
+    """
+    Pop every complete $$$-wrapped component off the front of a stream buffer.
     
     Components are wrapped with $$$ delimiters:
     $$${"type":"ChartComponent","id":"...","data":{...}}$$$
     
+    A bytearray.find scan for the fixed delimiter, with no regex or Match
+    objects per chunk.
+    
+    Plain text between components is discarded as it arrives, so ``buf`` only
+    ever holds the partial trailing fragment: an open component, or up to
+    two bytes that may begin the next delimiter.
+    
     Args:
-        response_text: Full streaming response text
+        buf: Bytes received so far and not yet tokenized (modified in place)
+        out: Stream for parse warnings (defaults to stdout)
         
     Returns:
-        List of parsed component dictionaries
+        List of parsed component dictionaries, in stream order
     """
-    pattern = re.escape(DELIMITER) + r'(.*?)' + re.escape(DELIMITER)
-    matches = re.findall(pattern, response_text)
-    
     components = []
-    for match in matches:
+    width = len(DELIMITER_BYTES)
+    cursor = 0
+    
+    # Scan forward with a cursor and trim the consumed prefix once at the end
+    while True:
+        start = buf.find(DELIMITER_BYTES, cursor)
+        if start < 0:
+            cursor = max(cursor, len(buf) - (width - 1))
+            break
+        end = buf.find(DELIMITER_BYTES, start + width)
+        if end < 0:
+            cursor = start
+            break
+        
+        raw = buf[start + width:end]
         try:
-            component = json.loads(match)
-            components.append(component)
+            components.append(_jloads(raw))
         except json.JSONDecodeError as e:
-            print(f"⚠️  Failed to parse component JSON: {e}")
-            print(f"   Raw JSON: {match[:100]}...")
+            print(f"⚠️  Failed to parse component JSON: {e}", file=out)
+            print(f"   Raw JSON: {raw[:100].decode('utf-8', 'replace')}...", file=out)
+        cursor = end + width
     
+    del buf[:cursor]
     return components
 
 
-def merge_chart_components(components: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+def merge_chart_components(
+    components: List[Dict[str, Any]],
+    merged: Optional[Dict[str, Dict[str, Any]]] = None,
+    series_indexes: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+) -> Dict[str, Dict[str, Any]]:
     """
     Merge chart component updates by ID (simulates frontend behavior).
     
@@ -72,62 +195,135 @@ def merge_chart_components(components: List[Dict[str, Any]]) -> Dict[str, Dict[s
     2. Series updates with new data points
     3. Frontend merges series.values arrays
     
+    Chart series are indexed by label per component ID (in ``series_indexes``,
+    outside the component dicts) so each update extends the existing values
+    list instead of rebuilding the series. Incremental callers pass the same
+    index with every call, next to ``merged``, so each series is indexed once
+    per stream rather than once per update.
+    
     Args:
         components: List of component updates from stream
+        merged: Existing merge state to update in place (for incremental use)
+        series_indexes: Series index for ``merged``, updated in place
+                        (component ID -> {series label -> series})
         
     Returns:
         Dictionary mapping component IDs to final merged state
     """
-    merged = {}
+    if merged is None:
+        merged = {}
+    if series_indexes is None:
+        series_indexes = {}
     
     for comp in components:
-        comp_id = comp.get("id")
-        comp_type = comp.get("type")
-        comp_data = comp.get("data", {})
+        comp_id = comp["id"]
+        comp_type = comp["type"]
+        comp_data = comp.get("data") or {}
+        entry = merged.get(comp_id)
         
-        if comp_id not in merged:
+        if entry is None:
             # First occurrence - initialize
             merged[comp_id] = comp
-        else:
-            # Subsequent update - merge data
-            existing_data = merged[comp_id]["data"]
-            
-            if comp_type == "ChartComponent":
-                # Merge chart series data
-                new_series = comp_data.get("series", [])
-                existing_series = existing_data.get("series", [])
-                
-                # Merge series by label
-                series_map = {s["label"]: s for s in existing_series}
-                
-                for new_s in new_series:
-                    label = new_s["label"]
-                    if label in series_map:
-                        # Merge values for existing series
-                        existing_values = series_map[label].get("values", [])
-                        new_values = new_s.get("values", [])
-                        series_map[label]["values"] = existing_values + new_values
-                    else:
-                        # Add new series
-                        series_map[label] = new_s
-                
-                existing_data["series"] = list(series_map.values())
-            
-            elif comp_type == "TableA":
-                # Merge table rows
-                new_rows = comp_data.get("rows", [])
-                existing_rows = existing_data.get("rows", [])
-                existing_data["rows"] = existing_rows + new_rows
+            continue
+        
+        # Subsequent update - merge data in place
+        entry_data = entry["data"]
+        
+        if comp_type == "ChartComponent":
+            # Merge chart series data by label
+            entry_series = entry_data.setdefault("series", [])
+            series_index = series_indexes.get(comp_id)
+            if series_index is None:
+                series_index = series_indexes[comp_id] = {
+                    s["label"]: s for s in entry_series
+                }
             
-            # Merge other fields
-            for key, value in comp_data.items():
-                if key not in ["series", "rows"]:
-                    existing_data[key] = value
+            for new_s in comp_data.get("series", []):
+                label = new_s["label"]
+                current = series_index.get(label)
+                if current is not None:
+                    # Extend values of existing series
+                    current.setdefault("values", []).extend(new_s.get("values", []))
+                else:
+                    # Add new series
+                    entry_series.append(new_s)
+                    series_index[label] = new_s
+        
+        elif comp_type == "TableA":
+            # Merge table rows
+            entry_data.setdefault("rows", []).extend(comp_data.get("rows", []))
+        
+        # Merge other fields
+        entry_data.update({k: v for k, v in comp_data.items() if k not in _SKIP})
     
     return merged
 
 
-def test_scenario(scenario_num: Union[int, str], description: str, message: str):
+def print_component_report(
+    merged: Dict[str, Dict[str, Any]],
+    component_count: int,
+    out: TextIO
+):
+    """
+    Print the final merged state of every component in a stream.
+    
+    Args:
+        merged: Merge state from merge_chart_components
+        component_count: Number of component updates received
+        out: Stream to write the report to
+    """
+    print(f"\n📊 Components Found: {component_count} total, {len(merged)} unique", file=out)
+    
+    for comp_id, comp in merged.items():
+        comp_type = comp.get("type")
+        comp_data = comp.get("data", {})
+        
+        print(f"\n   Component ID: {comp_id[:16]}...", file=out)
+        print(f"   Type: {comp_type}", file=out)
+        
+        if comp_type == "ChartComponent":
+            chart_type = comp_data.get("chart_type", "unknown")
+            title = comp_data.get("title", "No title")
+            x_axis = comp_data.get("x_axis", [])
+            series = comp_data.get("series", [])
+            
+            print(f"   Chart Type: {chart_type}", file=out)
+            print(f"   Title: {title}", file=out)
+            print(f"   X-Axis Labels: {x_axis}", file=out)
+            print("   Series:", file=out)
+            
+            for s in series:
+                label = s.get("label", "Unknown")
+                values = s.get("values", [])
+                print(f"      - {label}: {len(values)} points → {values}", file=out)
+        
+        elif comp_type == "TableA":
+            columns = comp_data.get("columns", [])
+            rows = comp_data.get("rows", [])
+            
+            print(f"   Columns: {columns}", file=out)
+            print(f"   Rows: {len(rows)} total", file=out)
+            for i, row in enumerate(rows[:3]):
+                print(f"      Row {i+1}: {row}", file=out)
+            if len(rows) > 3:
+                print(f"      ... ({len(rows) - 3} more rows)", file=out)
+        
+        elif comp_type == "SimpleComponent":
+            title = comp_data.get("title", "No title")
+            description = comp_data.get("description", "No description")
+            value = comp_data.get("value", "N/A")
+            
+            print(f"   Title: {title}", file=out)
+            print(f"   Description: {description}", file=out)
+            print(f"   Value: {value}", file=out)
+
+
+def test_scenario(
+    scenario_num: Union[int, str],
+    description: str,
+    message: str,
+    out: Optional[TextIO] = None
+):
     """
     Test a specific scenario and print results.
     
@@ -135,175 +331,227 @@ def test_scenario(scenario_num: Union[int, str], description: str, message: str)
         scenario_num: Test number
         description: Test description
         message: Message to send to API
+        out: Text stream with a binary ``buffer`` to write the report to
+             (defaults to stdout)
     """
-    print(f"\n{'='*80}")
-    print(f"TEST {scenario_num}: {description}")
-    print(f"{'='*80}")
-    print(f"Message: \"{message}\"\n")
+    out = out or sys.stdout
+    
+    out.write(SCENARIO_GROUP_HEADERS.get(scenario_num, ""))
+    out.write(f"\n{DSEP}\nTEST {scenario_num}: {description}\n{DSEP}\nMessage: \"{message}\"\n\n")
     
     try:
-        response = requests.post(
+        # The body is read to EOF (or the connection released) when the block exits
+        with SESSION.post(
             API_URL,
-            json={"message": message},
+            data=_jdumps({"message": message}),
+            headers=REQUEST_HEADERS,
             stream=True,
             timeout=30
-        )
-        
-        if response.status_code != 200:
-            print(f"❌ HTTP Error: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return
-        
-        # Collect full response
-        full_response = ""
-        print("📡 Streaming Response:")
-        print("-" * 80)
-        
-        for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-            if chunk:
-                full_response += chunk
-                print(chunk, end="", flush=True)
+        ) as response:
+            if response.status_code != 200:
+                print(f"❌ HTTP Error: {response.status_code}", file=out)
+                print(f"   Response: {response.text}", file=out)
+                return
+            
+            # Tokenize and merge components as soon as each one closes
+            buf = bytearray()
+            merged = {}
+            series_indexes = {}  # Chart series by label, kept across updates
+            component_count = 0
+            out.write(f"📡 Streaming Response:\n{SEP}\n")
+            out.flush()
+            
+            # Raw bytes go to the binary buffer from a writer thread, so this
+            # loop only reads the socket and tokenizes
+            display = BackgroundWriter(out.buffer)
+            with gc_paused():
+                try:
+                    for chunk in response.iter_content(chunk_size=None):
+                        if chunk:
+                            display.write(chunk)
+                            buf += chunk
+                            components = drain_components(buf, out)
+                            if components:
+                                component_count += len(components)
+                                merge_chart_components(components, merged, series_indexes)
+                finally:
+                    display.close()
         
-        print("\n" + "-" * 80)
+        print("\n" + SEP, file=out)
         
-        # Extract and merge components
-        components = extract_components(full_response)
-        merged = merge_chart_components(components)
+        print_component_report(merged, component_count, out)
         
-        print(f"\n📊 Components Found: {len(components)} total, {len(merged)} unique")
+        # Validation
+        print(f"\n✅ Test {scenario_num} Completed Successfully", file=out)
         
-        for comp_id, comp in merged.items():
-            comp_type = comp.get("type")
-            comp_data = comp.get("data", {})
-            
-            print(f"\n   Component ID: {comp_id[:16]}...")
-            print(f"   Type: {comp_type}")
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request Error: {e}", file=out)
+    except Exception as e:
+        print(f"❌ Unexpected Error: {e}", file=out)
+        import traceback
+        traceback.print_exc(file=out)
+
+
+async def test_scenario_async(
+    client: "httpx.AsyncClient",
+    scenario_num: Union[int, str],
+    description: str,
+    message: str,
+    out: Optional[TextIO] = None
+):
+    """
+    Async twin of test_scenario, streaming over a shared httpx.AsyncClient.
+    
+    Args:
+        client: Client shared by every scenario in the run
+        scenario_num: Test number
+        description: Test description
+        message: Message to send to API
+        out: Text stream with a binary ``buffer`` to write the report to
+             (defaults to stdout)
+    """
+    out = out or sys.stdout
+    
+    out.write(SCENARIO_GROUP_HEADERS.get(scenario_num, ""))
+    out.write(f"\n{DSEP}\nTEST {scenario_num}: {description}\n{DSEP}\nMessage: \"{message}\"\n\n")
+    
+    try:
+        async with client.stream(
+            "POST",
+            API_URL,
+            content=_jdumps({"message": message}),
+            headers=REQUEST_HEADERS,
+            timeout=30
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"❌ HTTP Error: {response.status_code}", file=out)
+                print(f"   Response: {response.text}", file=out)
+                return
             
-            if comp_type == "ChartComponent":
-                chart_type = comp_data.get("chart_type", "unknown")
-                title = comp_data.get("title", "No title")
-                x_axis = comp_data.get("x_axis", [])
-                series = comp_data.get("series", [])
-                
-                print(f"   Chart Type: {chart_type}")
-                print(f"   Title: {title}")
-                print(f"   X-Axis Labels: {x_axis}")
-                print("   Series:")
-                
-                for s in series:
-                    label = s.get("label", "Unknown")
-                    values = s.get("values", [])
-                    print(f"      - {label}: {len(values)} points → {values}")
-                
-            elif comp_type == "TableA":
-                columns = comp_data.get("columns", [])
-                rows = comp_data.get("rows", [])
-                
-                print(f"   Columns: {columns}")
-                print(f"   Rows: {len(rows)} total")
-                for i, row in enumerate(rows[:3]):
-                    print(f"      Row {i+1}: {row}")
-                if len(rows) > 3:
-                    print(f"      ... ({len(rows) - 3} more rows)")
+            buf = bytearray()
+            merged = {}
+            series_indexes = {}  # Chart series by label, kept across updates
+            component_count = 0
+            out.write(f"📡 Streaming Response ({response.http_version}):\n{SEP}\n")
+            out.flush()
             
-            elif comp_type == "SimpleComponent":
-                title = comp_data.get("title", "No title")
-                description = comp_data.get("description", "No description")
-                value = comp_data.get("value", "N/A")
-                
-                print(f"   Title: {title}")
-                print(f"   Description: {description}")
-                print(f"   Value: {value}")
+            display = FlushCoalescer(out.buffer)
+            with gc_paused():
+                try:
+                    async for chunk in response.aiter_bytes():
+                        display.write(chunk)
+                        buf += chunk
+                        components = drain_components(buf, out)
+                        if components:
+                            component_count += len(components)
+                            merge_chart_components(components, merged, series_indexes)
+                finally:
+                    display.flush()
         
-        # Validation
-        print(f"\n✅ Test {scenario_num} Completed Successfully")
+        print("\n" + SEP, file=out)
         
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Request Error: {e}")
+        print_component_report(merged, component_count, out)
+        
+        print(f"\n✅ Test {scenario_num} Completed Successfully", file=out)
+        
+    except httpx.HTTPError as e:
+        print(f"❌ Request Error: {e}", file=out)
     except Exception as e:
-        print(f"❌ Unexpected Error: {e}")
+        print(f"❌ Unexpected Error: {e}", file=out)
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=out)
+
+
+# (number, description, message) for every scenario in the suite
+SCENARIOS = (
+    (1, "Line Chart - Progressive Data", "show me a line chart"),
+    (2, "Bar Chart - Progressive Data", "show me a bar chart"),
+    (3, "Mixed Content - Text + Chart", "Can you show me a sales trend chart?"),
+    (4, "Revenue Bar Chart", "show me revenue by region"),
+    # Test 5: Backward Compatibility - previous phase components still work
+    ("5a", "SimpleComponent (Phase 1-2)", "show me a card"),
+    ("5b", "TableA Component (Phase 3)", "show me sales table"),
+)
+# Group headers printed ahead of a scenario's own header
+SCENARIO_GROUP_HEADERS = {
+    "5a": (
+        f"\n{DSEP}\n"
+        "TEST 5: Backward Compatibility\n"
+        f"{DSEP}\n"
+        "Testing that previous phase components still work...\n\n"
+    ),
+}
+MAX_CONCURRENT_SCENARIOS = 4
+
+
+def _capture_buffer() -> Tuple[io.BytesIO, TextIO]:
+    """Create a text stream (with a binary ``buffer``) that records into a BytesIO."""
+    raw = io.BytesIO()
+    return raw, io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+
+
+def _capture_scenario(scenario_num: Union[int, str], description: str, message: str) -> bytes:
+    """Run one scenario with its report captured so concurrent runs don't interleave."""
+    raw, out = _capture_buffer()
+    test_scenario(scenario_num, description, message, out=out)
+    out.flush()
+    return raw.getvalue()
 
 
 def run_all_tests():
     """Run all Phase 4 test scenarios."""
+    try:
+        sys.stdout.write(BANNER_PHASE4)
+        sys.stdout.flush()
+        
+        # Scenarios are independent streams, so run them concurrently over the
+        # pooled session; each report is captured and printed in order
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SCENARIOS) as executor:
+            reports = executor.map(lambda scenario: _capture_scenario(*scenario), SCENARIOS)
+            for report in reports:
+                sys.stdout.buffer.write(report)
+                sys.stdout.buffer.flush()
+        
+        # Final Summary
+        sys.stdout.write(BANNER_COMPLETE)
+    finally:
+        SESSION.close()
+
+
+async def run_all_tests_async():
+    """Run all Phase 4 scenarios at once on one event loop and one httpx client."""
+    if not HTTPX_AVAILABLE:
+        print("❌ --async requires httpx (pip install httpx)")
+        sys.exit(1)
     
-    print("="*80)
-    print("PHASE 4 TEST SUITE - Chart Component Progressive Streaming")
-    print("="*80)
-    print("Testing ChartComponent implementation with 5 scenarios:")
-    print("1. Line Chart - Progressive Data")
-    print("2. Bar Chart - Progressive Data")
-    print("3. Mixed Content - Text + Chart")
-    print("4. Multiple Charts - Line and Bar")
-    print("5. Backward Compatibility - Phase 1-3 Components")
-    print("="*80)
-    
-    # Test 1: Line Chart with Progressive Data
-    test_scenario(
-        1,
-        "Line Chart - Progressive Data",
-        "show me a line chart"
-    )
-    
-    # Test 2: Bar Chart with Progressive Data
-    test_scenario(
-        2,
-        "Bar Chart - Progressive Data",
-        "show me a bar chart"
-    )
-    
-    # Test 3: Mixed Content (Text + Chart)
-    test_scenario(
-        3,
-        "Mixed Content - Text + Chart",
-        "Can you show me a sales trend chart?"
-    )
-    
-    # Test 4: Multiple Charts (if backend supports - otherwise single chart)
-    test_scenario(
-        4,
-        "Revenue Bar Chart",
-        "show me revenue by region"
-    )
-    
-    # Test 5: Backward Compatibility
-    print(f"\n{'='*80}")
-    print("TEST 5: Backward Compatibility")
-    print(f"{'='*80}")
-    print("Testing that previous phase components still work...\n")
+    sys.stdout.write(BANNER_PHASE4)
+    sys.stdout.flush()
     
-    # Test SimpleComponent (Phase 1-2)
-    test_scenario(
-        "5a",
-        "SimpleComponent (Phase 1-2)",
-        "show me a card"
-    )
+    # Every scenario streams concurrently over the shared client (HTTP/2 when
+    # h2 is installed and the server supports it); reports print in order
+    captures = [_capture_buffer() for _ in SCENARIOS]
+    async with httpx.AsyncClient(http2=H2_AVAILABLE) as client:
+        await asyncio.gather(*(
+            test_scenario_async(client, *scenario, out=out)
+            for scenario, (_, out) in zip(SCENARIOS, captures)
+        ))
     
-    # Test TableA (Phase 3)
-    test_scenario(
-        "5b",
-        "TableA Component (Phase 3)",
-        "show me sales table"
-    )
+    for raw, out in captures:
+        out.flush()
+        sys.stdout.buffer.write(raw.getvalue())
+    sys.stdout.buffer.flush()
     
     # Final Summary
-    print("\n" + "="*80)
-    print("ALL PHASE 4 TESTS COMPLETED")
-    print("="*80)
-    print("\n✅ Phase 4 Implementation Verified!")
-    print("\nNext Steps:")
-    print("1. Implement frontend ChartComponent renderer")
-    print("2. Add chart merge logic to frontend state")
-    print("3. Create smooth progressive animations for charts")
-    print("4. Test with real-time data updates")
-    print("\n" + "="*80)
+    sys.stdout.write(BANNER_COMPLETE)
 
 
 if __name__ == "__main__":
     try:
-        run_all_tests()
+        if "--async" in sys.argv[1:]:
+            asyncio.run(run_all_tests_async())
+        else:
+            run_all_tests()
     except KeyboardInterrupt:
         print("\n\n⚠️  Tests interrupted by user")
         sys.exit(1)
@@ -1,37 +1,148 @@
 """
 Comprehensive Test Suite for Phase 5: Multi-Component Streaming
 Tests multiple instances of TableA and ChartComponent per response
+
+Set TEST_VERBOSE=1 to echo each streamed response to the terminal.
 """
 
+import codecs
+import io
 import requests
 import json
-import re
+import os
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
+# orjson decodes component payloads much faster; stdlib json is the fallback.
+# orjson.JSONDecodeError subclasses json's, so one except clause covers both.
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
 
-def extract_components_from_text(text: str) -> list[dict]:
+API_URL = "http://127.0.0.1:8001/chat"
+# Separators, built once
+SEP = "=" * 80
+DASH = "-" * 80
+# Echoing every chunk costs a write + flush per chunk, so it is opt-in
+VERBOSE = os.environ.get("TEST_VERBOSE") == "1"
+# Read size per iteration; urllib3 still hands back each chunked-encoding
+# frame as soon as it arrives, this only caps how much one iteration carries
+READ_CHUNK_SIZE = 64 * 1024
+
+# Component payloads are wrapped in $$$ delimiters
+DELIMITER = "$$$"
+# Shared read-only default for components without a data payload
+_EMPTY: dict = {}
+
+
+# One keep-alive session for the whole suite; the pool holds a connection
+# per concurrently running test
+_SESSION = requests.Session()
+
+
+@contextmanager
+def _post_stream(message: str) -> Iterator[requests.Response]:
     """
-    Extract JSON components from text using the $$$ delimiter pattern.
+    POST a chat message on the shared session and yield the streaming response.
     
-    Shared utility for both batch and streaming (incremental) parsing.
+    The response is closed when the block exits, so its pooled connection is
+    released even if the test fails partway through the stream.
+    
+    Raises:
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    with _SESSION.post(API_URL, json={"message": message}, stream=True, timeout=30) as response:
+        if not response.ok:
+            # Read the error body to EOF so the keep-alive connection is reusable
+            response.raw.drain_conn()
+        response.raise_for_status()
+        yield response
+
+
+def _scan_components(text: str, pos: int) -> Iterator[tuple[int, Optional[dict]]]:
+    """
+    Lazily parse every closed $$$ component in ``text`` starting at ``pos``.
     
     Args:
         text: Text containing embedded JSON components with $$$ delimiters
+        pos: Offset to start scanning from
         
-    Returns:
-        list[dict]: Parsed component dictionaries
+    Yields:
+        tuple: (position just past the component, parsed component or None
+                if the fragment is not valid JSON)
     """
-    components = []
-    pattern = r'\$\$\$({.*?})\$\$\$'
-    matches = re.findall(pattern, text, re.DOTALL)
-    
-    for match in matches:
+    width = len(DELIMITER)
+    
+    # Linear scan: pair each opening delimiter with the next closing one
+    while True:
+        start = text.find(DELIMITER, pos)
+        if start < 0:
+            return
+        end = text.find(DELIMITER, start + width)
+        if end < 0:
+            return
+        
+        pos = end + width
         try:
-            component = json.loads(match)
-            components.append(component)
+            component = _jloads(text[start + width:end])
         except json.JSONDecodeError:
+            yield pos, None
             continue
+        yield pos, component
+
+
+def iter_components(text: str) -> Iterator[dict]:
+    """
+    Yield JSON components from text using the $$$ delimiter pattern.
+    
+    Shared utility for both batch and streaming (incremental) parsing;
+    fragments that are not valid JSON are skipped.
+    
+    Args:
+        text: Text containing embedded JSON components with $$$ delimiters
+        
+    Yields:
+        dict: Parsed component dictionaries, in stream order
+    """
+    for _, component in _scan_components(text, 0):
+        if component is not None:
+            yield component
+
+
+def extract_components_from_text(text: str) -> list[dict]:
+    """List form of iter_components, for callers that need random access."""
+    return list(iter_components(text))
+
+
+class IncrementalExtractor:
+    """
+    Stateful extractor for a buffer that only ever grows.
+    
+    Remembers where the last closed component ended, so each feed() scans and
+    decodes only what arrived since; the components it found are in ``new``.
+    """
     
-    return components
+    def __init__(self):
+        self.pos = 0
+        self.new: list[dict] = []
+    
+    def feed(self, buf: str) -> list[dict]:
+        self.new = new = []
+        for self.pos, component in _scan_components(buf, self.pos):
+            if component is not None:
+                new.append(component)
+        return new
+    
+    def trim(self, buf: str) -> str:
+        """Drop the already-scanned prefix of ``buf`` and return the unscanned tail."""
+        tail = buf[self.pos:]
+        self.pos = 0
+        return tail
 
 
 def parse_components(response_text: str) -> list[dict]:
@@ -44,40 +155,72 @@ def parse_components(response_text: str) -> list[dict]:
     return extract_components_from_text(response_text)
 
 
-def test_multiple_tables():
-    """Test 1: Multiple Tables - Sales + Users"""
-    print("\n" + "="*80)
-    print("TEST 1: Multiple Tables (Sales + Users)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me two tables: sales and users"},
-        stream=True
-    )
-    
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
+def _emit(*lines: str):
+    """Write a block of lines (banners, summaries) with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_stream_header(title: str):
+    """Print the banner that precedes a (possibly hidden) streamed response."""
+    print(f"\n{title}\n")
+    if not VERBOSE:
+        print("   (stream echo off; set TEST_VERBOSE=1 to show it)")
+    # Raw chunks go to stdout.buffer, so push pending text out first
+    sys.stdout.flush()
+
+
+def _run_chat(message: str) -> tuple[dict[str, list[dict]], dict[str, set[str]]]:
+    """
+    POST a chat message, echo the stream, and group its components by ID.
     
-    components = parse_components(full_response)
+    Args:
+        message: Message to send to the chat endpoint
+        
+    Returns:
+        tuple: (component ID -> updates in stream order,
+                component type -> IDs of that type)
+    """
+    # Accumulate raw bytes and decode once at the end
+    buf = bytearray()
+    _print_stream_header("📡 Streaming Response:")
+    with _post_stream(message) as response:
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+            if chunk:
+                if VERBOSE:
+                    sys.stdout.buffer.write(chunk)
+                buf += chunk
+    sys.stdout.buffer.flush()
+    full_response = buf.decode("utf-8")
+    
+    _emit(
+        "\n\n" + DASH,
+        "📊 Analysis:",
+        DASH,
+    )
     
-    # Group by component ID
-    component_map = {}
-    for comp in components:
+    # Group by component ID, indexing IDs by type in the same pass
+    component_map = defaultdict(list)
+    by_type = defaultdict(set)
+    for comp in iter_components(full_response):
         comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
         component_map[comp_id].append(comp)
+        by_type[comp.get("type")].add(comp_id)
     
-    print(f"\n📊 Components Found: {len(components)} total, {len(component_map)} unique\n")
+    return component_map, by_type
+
+
+def test_multiple_tables():
+    """Test 1: Multiple Tables - Sales + Users"""
+    _emit(
+        "\n" + SEP,
+        "TEST 1: Multiple Tables (Sales + Users)",
+        SEP,
+    )
+    
+    component_map, by_type = _run_chat("show me two tables: sales and users")
+    
+    total = sum(len(updates) for updates in component_map.values())
+    print(f"\n📊 Components Found: {total} total, {len(component_map)} unique\n")
     
     for comp_id, updates in component_map.items():
         final = updates[-1]  # Last update is the most complete
@@ -85,9 +228,9 @@ def test_multiple_tables():
         print(f"   Type: {final.get('type')}")
         
         if final.get('type') == 'TableA':
-            data = final.get('data', {})
-            columns = data.get('columns', [])
-            rows = data.get('rows', [])
+            data = final.get('data') or _EMPTY
+            columns = data.get('columns', ())
+            rows = data.get('rows', ())
             print(f"   Columns: {columns}")
             print(f"   Rows: {len(rows)}")
             if rows:
@@ -95,7 +238,7 @@ def test_multiple_tables():
         print()
     
     # Verify we got 2 tables
-    table_count = sum(1 for updates in component_map.values() if updates[-1].get('type') == 'TableA')
+    table_count = len(by_type.get('TableA', ()))
     
     if table_count >= 2:
         print("✅ Test 1 Passed: Multiple tables streamed successfully")
@@ -107,38 +250,16 @@ def test_multiple_tables():
 
 def test_multiple_charts():
     """Test 2: Multiple Charts - Line + Bar"""
-    print("\n" + "="*80)
-    print("TEST 2: Multiple Charts (Sales Line + Revenue Bar)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me two charts: line and bar"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 2: Multiple Charts (Sales Line + Revenue Bar)",
+        SEP,
     )
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
-    
-    # Group by component ID
-    component_map = {}
-    for comp in components:
-        comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
-        component_map[comp_id].append(comp)
+    component_map, by_type = _run_chat("show me two charts: line and bar")
     
-    print(f"\n📊 Components Found: {len(components)} total, {len(component_map)} unique\n")
+    total = sum(len(updates) for updates in component_map.values())
+    print(f"\n📊 Components Found: {total} total, {len(component_map)} unique\n")
     
     for comp_id, updates in component_map.items():
         final = updates[-1]  # Last update is the most complete
@@ -146,21 +267,21 @@ def test_multiple_charts():
         print(f"   Type: {final.get('type')}")
         
         if final.get('type') == 'ChartComponent':
-            data = final.get('data', {})
+            data = final.get('data') or _EMPTY
             chart_type = data.get('chart_type')
             title = data.get('title')
-            series = data.get('series', [])
+            series = data.get('series', ())
             print(f"   Chart Type: {chart_type}")
             print(f"   Title: {title}")
             if series:
                 for s in series:
                     label = s.get('label')
-                    values = s.get('values', [])
+                    values = s.get('values', ())
                     print(f"   Series: {label} ({len(values)} points) → {values}")
         print()
     
     # Verify we got 2 charts
-    chart_count = sum(1 for updates in component_map.values() if updates[-1].get('type') == 'ChartComponent')
+    chart_count = len(by_type.get('ChartComponent', ()))
     
     if chart_count >= 2:
         print("✅ Test 2 Passed: Multiple charts streamed successfully")
@@ -172,45 +293,23 @@ def test_multiple_charts():
 
 def test_three_tables():
     """Test 3: Three Tables - Sales + Users + Products"""
-    print("\n" + "="*80)
-    print("TEST 3: Three Tables (Sales + Users + Products)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me three tables: sales, users, and products"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 3: Three Tables (Sales + Users + Products)",
+        SEP,
     )
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
-    
-    # Group by component ID
-    component_map = {}
-    for comp in components:
-        comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
-        component_map[comp_id].append(comp)
+    component_map, by_type = _run_chat("show me three tables: sales, users, and products")
     
-    print(f"\n📊 Components Found: {len(components)} total, {len(component_map)} unique\n")
+    total = sum(len(updates) for updates in component_map.values())
+    print(f"\n📊 Components Found: {total} total, {len(component_map)} unique\n")
     
     table_types = []
     for comp_id, updates in component_map.items():
         final = updates[-1]
         if final.get('type') == 'TableA':
-            data = final.get('data', {})
-            columns = data.get('columns', [])
+            data = final.get('data') or _EMPTY
+            columns = data.get('columns', ())
             # Infer table type from columns
             if "Sales" in columns:
                 table_types.append("sales")
@@ -219,7 +318,7 @@ def test_three_tables():
             elif "Price" in columns:
                 table_types.append("products")
             
-            print(f"   Table: {columns} ({len(data.get('rows', []))} rows)")
+            print(f"   Table: {columns} ({len(data.get('rows', ()))} rows)")
     
     print(f"\n   Table Types: {table_types}")
     
@@ -234,32 +333,17 @@ def test_three_tables():
 
 def test_mixed_components():
     """Test 4: Mixed Components - Card + Table + Chart"""
-    print("\n" + "="*80)
-    print("TEST 4: Mixed Components (SimpleComponent + TableA + ChartComponent)")
-    print("="*80)
+    _emit(
+        "\n" + SEP,
+        "TEST 4: Mixed Components (SimpleComponent + TableA + ChartComponent)",
+        SEP,
+    )
     
     # First send a card request, then table, then chart in sequence
     # This tests that the system can handle different types
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me a sales table"},
-        stream=True
-    )
+    _, by_type = _run_chat("show me a sales table")
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
-    
-    component_types = set(comp.get('type') for comp in components)
+    component_types = set(by_type)
     
     print(f"\n   Component Types Present: {component_types}")
     
@@ -276,56 +360,52 @@ def test_mixed_components():
 
 def test_progressive_interleaving():
     """Test 5: Verify Progressive Interleaving of Multiple Components"""
-    print("\n" + "="*80)
-    print("TEST 5: Progressive Interleaving (Multiple Charts)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me two charts"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 5: Progressive Interleaving (Multiple Charts)",
+        SEP,
     )
     
-    full_response = ""
     component_sequence = []
-    processed_count = 0  # Track how many components we've already processed
+    extractor = IncrementalExtractor()  # Tracks where already-parsed components end
     
-    print("\n📡 Streaming Response (tracking component order):\n")
+    _print_stream_header("📡 Streaming Response (tracking component order):")
     
+    # Decode only each new chunk (multi-byte characters may straddle chunks)
+    decoder = codecs.getincrementaldecoder("utf-8")()
     temp_buffer = ""
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-            temp_buffer += chunk
-            
-            # Try to extract components as they arrive using shared utility
-            all_components = extract_components_from_text(temp_buffer)
-            
-            # Only process new components we haven't seen yet
-            new_components = all_components[processed_count:]
-            for comp in new_components:
-                series = comp.get('data', {}).get('series', [])
-                data_points = len(series[0].get('values', [])) if series else 0
-                component_sequence.append({
-                    'id': comp.get('id'),
-                    'type': comp.get('type'),
-                    'data_points': data_points
-                })
+    with _post_stream("show me two charts") as response:
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+            if chunk:
+                if VERBOSE:
+                    sys.stdout.buffer.write(chunk)
+                temp_buffer += decoder.decode(chunk)
             
-            # Update processed count
-            processed_count = len(all_components)
-    
-    print("\n\n" + "-"*80)
-    print("📊 Component Update Sequence:")
-    print("-"*80)
+                # Extract only the components that closed since the last chunk, then
+                # keep just the open tail so the buffer stays about one component long
+                extractor.feed(temp_buffer)
+                temp_buffer = extractor.trim(temp_buffer)
+                for comp in extractor.new:
+                    series = (comp.get('data') or _EMPTY).get('series', ())
+                    data_points = len(series[0].get('values', ())) if series else 0
+                    component_sequence.append({
+                        'id': comp.get('id'),
+                        'type': comp.get('type'),
+                        'data_points': data_points
+                    })
+    
+    sys.stdout.buffer.flush()
+    
+    _emit(
+        "\n\n" + DASH,
+        "📊 Component Update Sequence:",
+        DASH,
+    )
     
     # Group updates by component ID
-    update_map = {}
+    update_map = defaultdict(list)
     for item in component_sequence:
         comp_id = item['id'][:8]  # Truncate for readability
-        if comp_id not in update_map:
-            update_map[comp_id] = []
         update_map[comp_id].append(item['data_points'])
     
     print()
@@ -346,48 +426,21 @@ def test_progressive_interleaving():
 
 def test_backward_compatibility():
     """Test 6: Backward Compatibility - Single Table/Chart still works"""
-    print("\n" + "="*80)
-    print("TEST 6: Backward Compatibility (Single Table)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me a sales table"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 6: Backward Compatibility (Single Table)",
+        SEP,
     )
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
-    
-    # Group by component ID
-    component_map = {}
-    for comp in components:
-        comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
-        component_map[comp_id].append(comp)
+    component_map, by_type = _run_chat("show me a sales table")
     
     # Verify we got exactly 1 table
-    table_count = sum(1 for updates in component_map.values() if updates[-1].get('type') == 'TableA')
+    table_ids = by_type.get('TableA', ())
+    table_count = len(table_ids)
     
     if table_count == 1:
-        final_table = None
-        for updates in component_map.values():
-            if updates[-1].get('type') == 'TableA':
-                final_table = updates[-1]
-                break
-        
-        rows = final_table.get('data', {}).get('rows', [])
+        final_table = component_map[next(iter(table_ids))][-1]
+        rows = (final_table.get('data') or _EMPTY).get('rows', ())
         print(f"\n   Single Table: {len(rows)} rows")
         print("✅ Test 6 Passed: Single table streaming still works (backward compatible)")
     else:
@@ -398,49 +451,29 @@ def test_backward_compatibility():
 
 def test_same_type_charts():
     """Test 7: Same Type Charts - Two Line Charts (Phase 5.1)"""
-    print("\n" + "="*80)
-    print("TEST 7: Same Type Charts (Two Line Charts)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me two line charts"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 7: Same Type Charts (Two Line Charts)",
+        SEP,
     )
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
+    component_map, by_type = _run_chat("show me two line charts")
     
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
-    
-    # Group by component ID
-    component_map = {}
-    for comp in components:
-        comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
-        component_map[comp_id].append(comp)
-    
-    print(f"\n📊 Components Found: {len(components)} total, {len(component_map)} unique\n")
+    total = sum(len(updates) for updates in component_map.values())
+    print(f"\n📊 Components Found: {total} total, {len(component_map)} unique\n")
     
     line_chart_count = 0
     for comp_id, updates in component_map.items():
         # Check FIRST update (skeleton) for chart_type, not last
         first = updates[0]
         if first.get('type') == 'ChartComponent':
-            data = first.get('data', {})
+            data = first.get('data') or _EMPTY
             chart_type = data.get('chart_type')
-            print(f"   Chart ID: {comp_id}")
-            print(f"   Type: {chart_type}")
-            print(f"   Title: {data.get('title')}")
+            _emit(
+                f"   Chart ID: {comp_id}",
+                f"   Type: {chart_type}",
+                f"   Title: {data.get('title')}",
+            )
             if chart_type == 'line':
                 line_chart_count += 1
             print()
@@ -456,46 +489,24 @@ def test_same_type_charts():
 
 def test_same_type_tables():
     """Test 8: Same Type Tables - Two Sales Tables (Phase 5.1)"""
-    print("\n" + "="*80)
-    print("TEST 8: Same Type Tables (Two Sales Tables)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me two sales tables"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 8: Same Type Tables (Two Sales Tables)",
+        SEP,
     )
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
-    
-    # Group by component ID
-    component_map = {}
-    for comp in components:
-        comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
-        component_map[comp_id].append(comp)
+    component_map, by_type = _run_chat("show me two sales tables")
     
-    print(f"\n📊 Components Found: {len(components)} total, {len(component_map)} unique\n")
+    total = sum(len(updates) for updates in component_map.values())
+    print(f"\n📊 Components Found: {total} total, {len(component_map)} unique\n")
     
     sales_table_count = 0
     for comp_id, updates in component_map.items():
         # Check FIRST update (skeleton) for columns, not last
         first = updates[0]
         if first.get('type') == 'TableA':
-            data = first.get('data', {})
-            columns = data.get('columns', [])
+            data = first.get('data') or _EMPTY
+            columns = data.get('columns', ())
             print(f"   Table ID: {comp_id}")
             print(f"   Columns: {columns}")
             # Check if it's a sales table (has Name, Sales, Region columns)
@@ -514,38 +525,16 @@ def test_same_type_tables():
 
 def test_multiple_delayed_cards():
     """Test 9: Multiple Delayed Cards (Phase 5.2) - Progressive SimpleComponent"""
-    print("\n" + "="*80)
-    print("TEST 9: Multiple Delayed Cards (Phase 5.2)")
-    print("="*80)
-    
-    response = requests.post(
-        "http://127.0.0.1:8001/chat",
-        json={"message": "show me two delayed cards"},
-        stream=True
+    _emit(
+        "\n" + SEP,
+        "TEST 9: Multiple Delayed Cards (Phase 5.2)",
+        SEP,
     )
     
-    full_response = ""
-    print("\n📡 Streaming Response:\n")
-    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-        if chunk:
-            print(chunk, end='', flush=True)
-            full_response += chunk
-    
-    print("\n\n" + "-"*80)
-    print("📊 Analysis:")
-    print("-"*80)
-    
-    components = parse_components(full_response)
+    component_map, by_type = _run_chat("show me two delayed cards")
     
-    # Group by component ID
-    component_map = {}
-    for comp in components:
-        comp_id = comp.get("id")
-        if comp_id not in component_map:
-            component_map[comp_id] = []
-        component_map[comp_id].append(comp)
-    
-    print(f"\n📊 Components Found: {len(components)} total, {len(component_map)} unique\n")
+    total = sum(len(updates) for updates in component_map.values())
+    print(f"\n📊 Components Found: {total} total, {len(component_map)} unique\n")
     
     delayed_card_count = 0
     for comp_id, updates in component_map.items():
@@ -556,19 +545,21 @@ def test_multiple_delayed_cards():
         
         if final.get('type') == 'SimpleComponent':
             # Check first update for title (delayed cards have title in initial update)
-            first_data = first.get('data', {})
-            final_data = final.get('data', {})
+            first_data = first.get('data') or _EMPTY
+            final_data = final.get('data') or _EMPTY
             
             title = first_data.get('title', final_data.get('title', ''))
             description = final_data.get('description', '')
             units = final_data.get('units', 0)
             value = final_data.get('value', 0)
             
-            print(f"   Title: {title}")
-            print(f"   Description: {description}")
-            print(f"   Units: {units}")
-            print(f"   Value: {value}")
-            print(f"   Updates: {len(updates)} progressive updates")
+            _emit(
+                f"   Title: {title}",
+                f"   Description: {description}",
+                f"   Units: {units}",
+                f"   Value: {value}",
+                f"   Updates: {len(updates)} progressive updates",
+            )
             
             # Check if it's a delayed card (has "Delayed Card" in title OR "units" field)
             if 'Delayed Card' in title or 'units' in final_data:
@@ -590,75 +581,91 @@ def test_multiple_delayed_cards():
         return False
 
 
-def main():
-    """Run all tests"""
-    print("\n" + "="*80)
-    print("🚀 PHASE 5 MULTI-COMPONENT STREAMING TEST SUITE (v0.5.2)")
-    print("="*80)
-    print("\nTesting backend at: http://127.0.0.1:8001")
-    print("Tests: Multiple Tables, Multiple Charts, Multiple Delayed Cards (Phase 5.2)")
-    print("\n" + "="*80)
-    
-    results = []
-    
-    try:
-        results.append(("Multiple Tables (2)", test_multiple_tables()))
-    except Exception as e:
-        print(f"\n❌ Test 1 Error: {e}")
-        results.append(("Multiple Tables (2)", False))
-    
-    try:
-        results.append(("Multiple Charts (2)", test_multiple_charts()))
-    except Exception as e:
-        print(f"\n❌ Test 2 Error: {e}")
-        results.append(("Multiple Charts (2)", False))
-    
-    try:
-        results.append(("Three Tables", test_three_tables()))
-    except Exception as e:
-        print(f"\n❌ Test 3 Error: {e}")
-        results.append(("Three Tables", False))
-    
-    try:
-        results.append(("Mixed Components", test_mixed_components()))
-    except Exception as e:
-        print(f"\n❌ Test 4 Error: {e}")
-        results.append(("Mixed Components", False))
-    
-    try:
-        results.append(("Progressive Interleaving", test_progressive_interleaving()))
-    except Exception as e:
-        print(f"\n❌ Test 5 Error: {e}")
-        results.append(("Progressive Interleaving", False))
+_thread_output = threading.local()
+
+
+class _ThreadStdout:
+    """
+    sys.stdout stand-in that sends each test thread's output to its own buffer.
     
-    try:
-        results.append(("Backward Compatibility", test_backward_compatibility()))
-    except Exception as e:
-        print(f"\n❌ Test 6 Error: {e}")
-        results.append(("Backward Compatibility", False))
+    Threads without a capture buffer (such as the main thread) write through
+    to the real stdout.
+    """
     
-    try:
-        results.append(("Same Type Charts (Phase 5.1)", test_same_type_charts()))
-    except Exception as e:
-        print(f"\n❌ Test 7 Error: {e}")
-        results.append(("Same Type Charts (Phase 5.1)", False))
+    def __init__(self, stream):
+        self._stream = stream
     
+    def __getattr__(self, name):
+        return getattr(getattr(_thread_output, "stream", self._stream), name)
+
+
+def _safe_run(num: int, test_fn) -> tuple[bool, bytes]:
+    """Run one test with its output captured; an exception counts as a failure."""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    _thread_output.stream = stream
     try:
-        results.append(("Same Type Tables (Phase 5.1)", test_same_type_tables()))
+        passed = test_fn()
     except Exception as e:
-        print(f"\n❌ Test 8 Error: {e}")
-        results.append(("Same Type Tables (Phase 5.1)", False))
+        print(f"\n❌ Test {num} Error: {e}")
+        passed = False
+    finally:
+        del _thread_output.stream
+    stream.flush()
+    return passed, raw.getvalue()
+
+
+def main():
+    """Run all tests"""
+    _emit(
+        "\n" + SEP,
+        "🚀 PHASE 5 MULTI-COMPONENT STREAMING TEST SUITE (v0.5.2)",
+        SEP,
+        "\nTesting backend at: http://127.0.0.1:8001",
+        "Tests: Multiple Tables, Multiple Charts, Multiple Delayed Cards (Phase 5.2)",
+        "\n" + SEP,
+    )
     
+    # Tests are independent streams, so run them all at once; each test's
+    # output is captured per thread and printed whole as it finishes
+    tests = [
+        (1, "Multiple Tables (2)", test_multiple_tables),
+        (2, "Multiple Charts (2)", test_multiple_charts),
+        (3, "Three Tables", test_three_tables),
+        (4, "Mixed Components", test_mixed_components),
+        (5, "Progressive Interleaving", test_progressive_interleaving),
+        (6, "Backward Compatibility", test_backward_compatibility),
+        (7, "Same Type Charts (Phase 5.1)", test_same_type_charts),
+        (8, "Same Type Tables (Phase 5.1)", test_same_type_tables),
+        (9, "Multiple Delayed Cards (Phase 5.2)", test_multiple_delayed_cards),
+    ]
+    outcomes = {}
+    real_stdout = sys.stdout
+    real_stdout.flush()
+    sys.stdout = _ThreadStdout(real_stdout)
     try:
-        results.append(("Multiple Delayed Cards (Phase 5.2)", test_multiple_delayed_cards()))
-    except Exception as e:
-        print(f"\n❌ Test 9 Error: {e}")
-        results.append(("Multiple Delayed Cards (Phase 5.2)", False))
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {
+                executor.submit(_safe_run, num, fn): name
+                for num, name, fn in tests
+            }
+            for future in as_completed(futures):
+                passed, report = future.result()
+                outcomes[futures[future]] = passed
+                real_stdout.buffer.write(report)
+                real_stdout.buffer.flush()
+    finally:
+        sys.stdout = real_stdout
+        _SESSION.close()
+    
+    results = [(name, outcomes[name]) for _, name, _ in tests]
     
     # Summary
-    print("\n" + "="*80)
-    print("📋 TEST SUMMARY")
-    print("="*80)
+    _emit(
+        "\n" + SEP,
+        "📋 TEST SUMMARY",
+        SEP,
+    )
     
     for test_name, passed in results:
         status = "✅ PASS" if passed else "❌ FAIL"
@@ -667,9 +674,11 @@ def main():
     passed_count = sum(1 for _, passed in results if passed)
     total_count = len(results)
     
-    print("\n" + "="*80)
-    print(f"Results: {passed_count}/{total_count} tests passed")
-    print("="*80)
+    _emit(
+        "\n" + SEP,
+        f"Results: {passed_count}/{total_count} tests passed",
+        SEP,
+    )
     
     if passed_count == total_count:
         print("\n🎉 All tests passed! Phase 5 multi-component streaming is working correctly.")
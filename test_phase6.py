@@ -9,30 +9,152 @@ Run with: python test_phase6.py
 
 import asyncio
 import json
+import logging
 import sys
-from typing import Dict, Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, '.')
 
 from services.llm.llm_planner_service import LLMPlannerService
 
+# orjson serializes straight to bytes; stdlib json is the fallback
+try:
+    from orjson import dumps as _jdumps
+except ImportError:
+    def _jdumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 
 # ============================================================================
 # Mock Bedrock Response Generator
 # ============================================================================
 
-def create_mock_bedrock_response(components: list) -> Dict[str, Any]:
-    """Create a mock Bedrock API response."""
-    component_json = json.dumps(components)
-    llm_text = f"$$${component_json}$$$"
+class _FakeEventStream:
+    """Bedrock response stream: async-iterates the pre-built chunk events, then raises error if set."""
+
+    def __init__(self, events: List[Dict[str, Any]], error: Optional[Exception] = None):
+        self._events = events
+        self._error = error
+
+    async def _iterate(self):
+        for event in self._events:
+            yield event
+        if self._error is not None:
+            raise self._error
+
+    def __aiter__(self):
+        return self._iterate()
+
+
+def create_mock_bedrock_stream_events(text_chunks: List[str]) -> List[Dict[str, Any]]:
+    """Create Anthropic streaming events delivering text_chunks as text deltas."""
+    events = [{'chunk': {'bytes': _jdumps({'type': 'message_start'})}}]
+    for text in text_chunks:
+        events.append({'chunk': {'bytes': _jdumps({
+            'type': 'content_block_delta',
+            'delta': {'type': 'text_delta', 'text': text}
+        })}})
+    events.append({'chunk': {'bytes': _jdumps({'type': 'message_stop'})}})
+    return events
+
+
+def split_text(text: str, size: int) -> List[str]:
+    """Split text into size-character chunks, as a model stream would deliver it."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def create_mock_bedrock_response(components: list) -> List[str]:
+    """Create a mock Bedrock stream delivering components as a $$$-delimited array."""
+    component_json = _jdumps(components).decode()
+    return create_mock_bedrock_text_response(f"$$${component_json}$$$")
+
+
+def create_mock_bedrock_text_response(llm_text: str) -> List[str]:
+    """Create a mock Bedrock stream carrying raw LLM text in small deltas."""
+    return split_text(llm_text, 32)
+
+
+class FakeBedrockClient:
+    """
+    In-process Bedrock stub standing in for the whole aioboto3 chain.
+
+    aioboto3.Session() -> session.client(...) -> async with -> client all
+    resolve to this one object, and invoke_model_with_response_stream streams
+    the canned text.
+    """
+
+    def __init__(self):
+        self.stream_events: List[Dict[str, Any]] = []
+        self.stream_error: Optional[Exception] = None
+        self.invoke_count = 0
+
+    def set_stream(self, text_chunks: List[str], error: Optional[Exception] = None) -> None:
+        """
+        Answer every invoke_model_with_response_stream with text_chunks and reset the call count.
+
+        If error is given, each stream raises it after the last chunk.
+        """
+        self.stream_events = create_mock_bedrock_stream_events(text_chunks)
+        self.stream_error = error
+        self.invoke_count = 0
+
+    def __call__(self) -> "FakeBedrockClient":
+        return self
+
+    def client(self, **kwargs) -> "FakeBedrockClient":
+        return self
+
+    async def __aenter__(self) -> "FakeBedrockClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+    async def invoke_model_with_response_stream(self, **kwargs) -> Dict[str, Any]:
+        self.invoke_count += 1
+        return {'body': _FakeEventStream(self.stream_events, self.stream_error)}
+
+
+# One stub shared by every test; each test only swaps in its response
+_FAKE_BEDROCK = FakeBedrockClient()
+
+
+# One planner service shared by every test
+_SERVICE = LLMPlannerService()
 
-    return {
-        'body': AsyncMock(read=AsyncMock(return_value=json.dumps({
-            'content': [{'text': llm_text}]
-        }).encode()))
-    }
+
+async def _fresh_service() -> LLMPlannerService:
+    """
+    Return the shared planner service, reset to its just-constructed state.
+
+    The Bedrock client is closed so the next call opens a new one through the
+    calling test's patched aioboto3.Session, whichever test ran before.
+    """
+    await _SERVICE.close()
+    _SERVICE._inflight.clear()
+    _SERVICE.clear_cache()
+    return _SERVICE
+
+
+@contextmanager
+def _patched_bedrock(text_chunks: List[str], error: Optional[Exception] = None):
+    """Patch aioboto3.Session to hand out the shared stub, streaming text_chunks (then error)."""
+    _FAKE_BEDROCK.set_stream(text_chunks, error)
+    with patch('aioboto3.Session', _FAKE_BEDROCK):
+        yield _FAKE_BEDROCK
+
+
+async def _collect_stream(service: LLMPlannerService, message: str) -> List[Dict[str, Any]]:
+    """Drain generate_layout_stream into a list."""
+    return [component async for component in service.generate_layout_stream(message)]
+
+
+def _is_fallback_layout(components: List[Dict[str, Any]]) -> bool:
+    """True if components are the planner's default fallback layout."""
+    return [c["data"].get("title") for c in components[:1]] == ["Dashboard Summary"]
 
 
 # ============================================================================
@@ -43,7 +165,7 @@ async def test_basic_plan_generation():
     """Test that LLM service generates a valid 3-component plan."""
     print("\n🧪 Test 1: Basic Plan Generation")
 
-    service = LLMPlannerService()
+    service = await _fresh_service()
 
     # Mock Bedrock response
     mock_components = [
@@ -75,12 +197,10 @@ async def test_basic_plan_generation():
     mock_response = create_mock_bedrock_response(mock_components)
 
     # Mock the Bedrock client
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         result = await service.generate_layout("show me sales dashboard")
+        assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
 
         # Validate result structure
         assert "components" in result, "Result should have 'components'"
@@ -111,7 +231,7 @@ async def test_chart_detection():
     """Test that LLM generates chart for trend queries."""
     print("\n🧪 Test 2: Chart Detection")
 
-    service = LLMPlannerService()
+    service = await _fresh_service()
 
     mock_components = [
         {
@@ -127,12 +247,10 @@ async def test_chart_detection():
 
     mock_response = create_mock_bedrock_response(mock_components)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         result = await service.generate_layout("show me sales trend over time")
+        assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
 
         components = result["components"]
         assert len(components) >= 1, "Should have at least 1 component"
@@ -152,7 +270,7 @@ async def test_table_detection():
     """Test that LLM generates table for list queries."""
     print("\n🧪 Test 3: Table Detection")
 
-    service = LLMPlannerService()
+    service = await _fresh_service()
 
     mock_components = [
         {
@@ -169,12 +287,10 @@ async def test_table_detection():
 
     mock_response = create_mock_bedrock_response(mock_components)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         result = await service.generate_layout("list all users")
+        assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
 
         components = result["components"]
         table_found = any(c["type"] == "TableA" for c in components)
@@ -192,8 +308,7 @@ async def test_cache_hit():
     """Test that second identical call uses cache."""
     print("\n🧪 Test 4: Cache Hit")
 
-    service = LLMPlannerService()
-    service.clear_cache()  # Clear any existing cache
+    service = await _fresh_service()
 
     mock_components = [
         {
@@ -204,20 +319,18 @@ async def test_cache_hit():
 
     mock_response = create_mock_bedrock_response(mock_components)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         # First call - should call Bedrock
         result1 = await service.generate_layout("show me dashboard")
         assert result1["from_cache"] is False, "First call should not be from cache"
-        first_call_count = mock_client.invoke_model.call_count
+        first_call_count = fake_bedrock.invoke_count
+        assert first_call_count == 1, "First call should call Bedrock once"
 
         # Second call - should use cache
         result2 = await service.generate_layout("show me dashboard")
         assert result2["from_cache"] is True, "Second call should be from cache"
-        second_call_count = mock_client.invoke_model.call_count
+        second_call_count = fake_bedrock.invoke_count
 
         # Bedrock should not be called again
         assert first_call_count == second_call_count, "Bedrock should not be called for cached query"
@@ -235,7 +348,7 @@ async def test_invalid_json_recovery():
     """Test that service handles and recovers from malformed JSON."""
     print("\n🧪 Test 5: Invalid JSON Recovery")
 
-    service = LLMPlannerService()
+    service = await _fresh_service()
 
     # Test with markdown code blocks (common LLM output)
     malformed_json = '''```json
@@ -244,18 +357,12 @@ $$$[
 ]$$$
 ```'''
 
-    mock_response = {
-        'body': AsyncMock(read=AsyncMock(return_value=json.dumps({
-            'content': [{'text': malformed_json}]
-        }).encode()))
-    }
+    mock_response = create_mock_bedrock_text_response(malformed_json)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         result = await service.generate_layout("test markdown recovery")
+        assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
 
         # Should successfully parse despite markdown wrapper
         components = result["components"]
@@ -273,7 +380,7 @@ async def test_component_validation():
     """Test that service validates and filters invalid components."""
     print("\n🧪 Test 6: Component Validation")
 
-    service = LLMPlannerService()
+    service = await _fresh_service()
 
     # Mix of valid and invalid components
     mock_components = [
@@ -306,12 +413,10 @@ async def test_component_validation():
 
     mock_response = create_mock_bedrock_response(mock_components)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         result = await service.generate_layout("test validation")
+        assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
 
         components = result["components"]
 
@@ -335,7 +440,7 @@ async def test_multi_component_response():
     """Test that service can handle complex multi-type responses."""
     print("\n🧪 Test 7: Multi-Component Response")
 
-    service = LLMPlannerService()
+    service = await _fresh_service()
 
     mock_components = [
         {
@@ -365,12 +470,10 @@ async def test_multi_component_response():
 
     mock_response = create_mock_bedrock_response(mock_components)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         result = await service.generate_layout("show me complete dashboard")
+        assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
 
         components = result["components"]
 
@@ -391,8 +494,7 @@ async def test_cache_clear():
     """Test that cache can be cleared."""
     print("\n🧪 Test 8: Cache Clear")
 
-    service = LLMPlannerService()
-    service.clear_cache()
+    service = await _fresh_service()
 
     mock_components = [
         {
@@ -403,18 +505,17 @@ async def test_cache_clear():
 
     mock_response = create_mock_bedrock_response(mock_components)
 
-    with patch('aioboto3.Session') as mock_session:
-        mock_client = AsyncMock()
-        mock_client.invoke_model = AsyncMock(return_value=mock_response)
-        mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+    with _patched_bedrock(mock_response) as fake_bedrock:
 
         # First call
         result1 = await service.generate_layout("test cache")
         assert result1["from_cache"] is False
+        assert fake_bedrock.invoke_count == 1, "First call should call Bedrock"
 
         # Second call - should be cached
         result2 = await service.generate_layout("test cache")
         assert result2["from_cache"] is True
+        assert fake_bedrock.invoke_count == 1, "Cached call should not call Bedrock"
 
         # Clear cache
         service.clear_cache()
@@ -422,37 +523,446 @@ async def test_cache_clear():
         # Third call - should NOT be cached after clear
         result3 = await service.generate_layout("test cache")
         assert result3["from_cache"] is False
+        assert fake_bedrock.invoke_count == 2, "Call after clear should call Bedrock again"
 
         print(f"   ✅ Cache populated: from_cache={result2['from_cache']}")
         print(f"   ✅ Cache cleared successfully")
         print(f"   ✅ New call after clear: from_cache={result3['from_cache']}")
 
 
+# ============================================================================
+# Test 9: Half-Fenced JSON Recovery
+# ============================================================================
+
+async def test_half_fenced_json_recovery():
+    """Test that output fenced on one side only still parses."""
+    print("\n🧪 Test 9: Half-Fenced JSON Recovery")
+
+    component_json = '[{"type":"SimpleComponent","data":{"title":"Half Fenced"}}]'
+    cases = [
+        ("opening fence only", f"$$$```json\n{component_json}$$$"),
+        ("closing fence only", f"{component_json}\n```"),
+    ]
+
+    for label, llm_text in cases:
+        service = await _fresh_service()
+        mock_response = create_mock_bedrock_text_response(llm_text)
+
+        with _patched_bedrock(mock_response):
+
+            result = await service.generate_layout(f"test {label}")
+
+            # The fallback layout would also have components, so check for it
+            assert not result.get("fallback"), f"{label}: should not fall back"
+            components = result["components"]
+            assert len(components) == 1, f"{label}: should parse 1 component, got {len(components)}"
+            assert components[0]["data"]["title"] == "Half Fenced"
+
+            print(f"   ✅ Parsed with {label}")
+
+
+# ============================================================================
+# Test 10: Streaming - Chunks Split Mid-Token
+# ============================================================================
+
+async def test_stream_split_chunks():
+    """Test that components split across stream chunks (inside braces and strings) are reassembled."""
+    print("\n🧪 Test 10: Streaming - Chunks Split Mid-Token")
+
+    mock_components = [
+        {
+            "type": "SimpleComponent",
+            "data": {"title": "Braces {in} [strings]", "description": "}]{["}
+        },
+        {
+            "type": "ChartComponent",
+            "data": {
+                "chart_type": "line",
+                "title": "Nested",
+                "x_axis": ["Jan", "Feb"],
+                "series": [{"label": "Sales", "values": [1, 2]}]
+            }
+        }
+    ]
+    llm_text = "```json\n$$$" + json.dumps(mock_components) + "$$$\n```"
+
+    for size in (1, 7):
+        service = await _fresh_service()
+
+        with _patched_bedrock(split_text(llm_text, size)) as fake_bedrock:
+
+            components = await _collect_stream(service, f"stream split {size}")
+
+            assert fake_bedrock.invoke_count == 1, "Bedrock should be called once"
+            assert [c["data"] for c in components] == [c["data"] for c in mock_components], \
+                f"Chunk size {size}: components not reassembled: {components}"
+            assert all("id" in c for c in components), "Streamed components should have IDs"
+
+            print(f"   ✅ Chunk size {size}: {len(components)} components reassembled")
+
+
+# ============================================================================
+# Test 11: Streaming - Escaped Quotes
+# ============================================================================
+
+async def test_stream_escaped_quotes():
+    """Test that escaped quotes and backslashes inside strings do not end the string early."""
+    print("\n🧪 Test 11: Streaming - Escaped Quotes")
+
+    service = await _fresh_service()
+
+    title = 'Say "hi" {not a brace} \\'
+    mock_components = [
+        {"type": "SimpleComponent", "data": {"title": title}},
+        {"type": "SimpleComponent", "data": {"title": "Second"}}
+    ]
+    llm_text = "$$$" + json.dumps(mock_components) + "$$$"
+
+    with _patched_bedrock(split_text(llm_text, 3)):
+
+        components = await _collect_stream(service, "stream escaped quotes")
+
+        titles = [c["data"]["title"] for c in components]
+        assert titles == [title, "Second"], f"Unexpected titles: {titles}"
+
+        print(f"   ✅ Escaped quotes preserved: {titles[0]!r}")
+
+
+# ============================================================================
+# Test 12: Streaming - Invalid Items Skipped
+# ============================================================================
+
+async def test_stream_invalid_item_skipped():
+    """Test that undecodable and schema-invalid streamed items are skipped."""
+    print("\n🧪 Test 12: Streaming - Invalid Items Skipped")
+
+    service = await _fresh_service()
+
+    llm_text = (
+        '$$$['
+        '{"type":"SimpleComponent","data":{"title":"First"}},'
+        '{"type":"TableA","data":{"columns":["A"]}},'  # Missing rows
+        '{"type": not json},'  # Undecodable
+        '{"type":"SimpleComponent","data":{"title":"Last"}}'
+        ']$$$'
+    )
+
+    with _patched_bedrock(split_text(llm_text, 5)):
+
+        components = await _collect_stream(service, "stream invalid items")
+
+        titles = [c["data"]["title"] for c in components]
+        assert titles == ["First", "Last"], f"Should keep 2 valid components, got {titles}"
+
+        print(f"   ✅ Kept {len(components)} valid components of 4 streamed")
+
+
+# ============================================================================
+# Test 13: Streaming - MAX_COMPONENTS Cut-off
+# ============================================================================
+
+async def test_stream_max_components():
+    """Test that streaming stops after MAX_COMPONENTS items."""
+    print("\n🧪 Test 13: Streaming - MAX_COMPONENTS Cut-off")
+
+    service = await _fresh_service()
+    limit = LLMPlannerService.MAX_COMPONENTS
+
+    mock_components = [
+        {"type": "SimpleComponent", "data": {"title": f"Card {i}"}}
+        for i in range(limit + 3)
+    ]
+    llm_text = "$$$" + json.dumps(mock_components) + "$$$"
+
+    with _patched_bedrock(split_text(llm_text, 16)):
+
+        components = await _collect_stream(service, "stream max components")
+
+        titles = [c["data"]["title"] for c in components]
+        assert titles == [f"Card {i}" for i in range(limit)], \
+            f"Should stop at {limit} components, got {titles}"
+
+        print(f"   ✅ Stopped at {len(components)} of {len(mock_components)} components")
+
+
+# ============================================================================
+# Test 14: Streaming - Fallback on Empty or Garbage Stream
+# ============================================================================
+
+async def test_stream_fallback():
+    """Test that an empty or component-less stream yields the fallback layout."""
+    print("\n🧪 Test 14: Streaming - Fallback on Empty or Garbage Stream")
+
+    cases = [
+        ("empty stream", []),
+        ("garbage stream", split_text("I cannot help with that request.", 4)),
+        ("unterminated array", split_text('$$$[{"type":"SimpleComponent","data":{"ti', 4)),
+    ]
+
+    for label, chunks in cases:
+        service = await _fresh_service()
+
+        with _patched_bedrock(chunks):
+
+            components = await _collect_stream(service, f"stream {label}")
+
+            assert _is_fallback_layout(components), f"{label}: should yield the fallback layout"
+            assert len(components) == 3, f"{label}: fallback should have 3 components"
+
+            print(f"   ✅ {label}: fallback layout streamed")
+
+
+# ============================================================================
+# Test 15: Streaming - Bare Object and Single Quotes
+# ============================================================================
+
+async def test_stream_lenient_json():
+    """Test that streaming accepts a bare object and single-quoted JSON, like generate_layout."""
+    print("\n🧪 Test 15: Streaming - Bare Object and Single Quotes")
+
+    cases = [
+        ("bare object", '$$${"type":"SimpleComponent","data":{"title":"Lenient"}}$$$'),
+        ("single quotes", "$$$[{'type':'SimpleComponent','data':{'title':'Lenient'}}]$$$"),
+    ]
+
+    for label, llm_text in cases:
+        service = await _fresh_service()
+
+        with _patched_bedrock(split_text(llm_text, 6)):
+
+            components = await _collect_stream(service, f"stream {label}")
+
+            titles = [c["data"]["title"] for c in components]
+            assert titles == ["Lenient"], f"{label}: expected 1 parsed component, got {titles}"
+
+            print(f"   ✅ {label}: parsed")
+
+
+# ============================================================================
+# Test 16: Single-Flight Deduplication
+# ============================================================================
+
+async def test_single_flight():
+    """Test that concurrent identical requests share one Bedrock call."""
+    print("\n🧪 Test 16: Single-Flight Deduplication")
+
+    service = await _fresh_service()
+
+    mock_components = [
+        {"type": "SimpleComponent", "data": {"title": "Shared", "description": "One call"}}
+    ]
+    mock_response = create_mock_bedrock_response(mock_components)
+
+    with _patched_bedrock(mock_response) as fake_bedrock:
+
+        result1, result2 = await asyncio.gather(
+            service.generate_layout("show me shared dashboard"),
+            service.generate_layout("Show me shared dashboard "),  # Same cache key
+        )
+
+        assert fake_bedrock.invoke_count == 1, \
+            f"Concurrent identical requests should call Bedrock once, got {fake_bedrock.invoke_count}"
+        assert result1 is result2, "Both callers should get the shared result"
+        assert not service._inflight, "In-flight entry should be removed once done"
+
+        print(f"   ✅ Bedrock calls: {fake_bedrock.invoke_count} for 2 concurrent requests")
+        print("   ✅ In-flight map cleaned up")
+
+
+# ============================================================================
+# Test 17: LRU Eviction
+# ============================================================================
+
+async def test_cache_lru_eviction():
+    """Test that the cache evicts the least recently used entry beyond CACHE_MAX_ENTRIES."""
+    print("\n🧪 Test 17: LRU Eviction")
+
+    service = await _fresh_service()
+    limit = LLMPlannerService.CACHE_MAX_ENTRIES
+    keys = [service._generate_cache_key(f"message {i}") for i in range(limit + 2)]
+
+    # Quiet the planner's per-store INFO logging while filling the cache
+    planner_logger = logging.getLogger("llm_planner")
+    previous_level = planner_logger.level
+    planner_logger.setLevel(logging.WARNING)
+    try:
+        for i, key in enumerate(keys[:limit]):
+            service._store_in_cache(key, {"components": [], "from_cache": False, "index": i})
+    finally:
+        planner_logger.setLevel(previous_level)
+
+    # Touch the oldest entry so the second oldest becomes least recently used
+    assert service._get_from_cache(keys[0]) is not None
+
+    service._store_in_cache(keys[limit], {"components": [], "from_cache": False})
+    assert len(service._cache) == limit, f"Cache should stay at {limit} entries"
+    assert service._get_from_cache(keys[1]) is None, "Least recently used entry should be evicted"
+    assert service._get_from_cache(keys[0]) is not None, "Recently used entry should survive"
+
+    service._store_in_cache(keys[limit + 1], {"components": [], "from_cache": False})
+    assert service._get_from_cache(keys[2]) is None, "Next oldest entry should be evicted"
+    assert len(service._cache) == limit
+
+    print(f"   ✅ Cache bounded at {limit} entries, least recently used evicted")
+
+    service.clear_cache()
+
+
+# ============================================================================
+# Test 18: Streaming Single-Flight
+# ============================================================================
+
+async def test_stream_single_flight():
+    """Test that concurrent identical streams and layouts share one Bedrock stream."""
+    print("\n🧪 Test 18: Streaming Single-Flight")
+
+    service = await _fresh_service()
+
+    mock_components = [
+        {"type": "SimpleComponent", "data": {"title": f"Shared {i}"}}
+        for i in range(3)
+    ]
+
+    with _patched_bedrock(create_mock_bedrock_response(mock_components)) as fake_bedrock:
+
+        stream1, stream2, layout = await asyncio.gather(
+            _collect_stream(service, "stream shared dashboard"),
+            _collect_stream(service, "Stream shared dashboard "),  # Same cache key
+            service.generate_layout("stream shared dashboard"),
+        )
+
+        assert fake_bedrock.invoke_count == 1, \
+            f"Concurrent identical requests should stream once, got {fake_bedrock.invoke_count}"
+        assert stream1 == stream2 == layout["components"], "All callers should get the same components"
+        assert len({c["id"] for c in stream1}) == 3, "Components should have distinct IDs"
+        assert not service._inflight, "In-flight entry should be removed once done"
+
+        print(f"   ✅ Bedrock calls: {fake_bedrock.invoke_count} for 3 concurrent requests")
+
+
+# ============================================================================
+# Test 19: Streaming - Whole-Text Recovery
+# ============================================================================
+
+async def test_stream_whole_text_recovery():
+    """Test that output the incremental parser cannot read is re-parsed as a whole."""
+    print("\n🧪 Test 19: Streaming - Whole-Text Recovery")
+
+    service = await _fresh_service()
+
+    # The bracket in the prose makes the incremental parser close an empty array
+    llm_text = 'Here are [2] components: $$$[{"type":"SimpleComponent","data":{"title":"Recovered"}}]$$$'
+
+    with _patched_bedrock(create_mock_bedrock_text_response(llm_text)):
+
+        components = await _collect_stream(service, "stream whole text recovery")
+
+        assert not _is_fallback_layout(components), "Should not fall back"
+        titles = [c["data"]["title"] for c in components]
+        assert titles == ["Recovered"], f"Expected the delimited component, got {titles}"
+        assert "id" in components[0], "Recovered component should have an ID"
+
+        print("   ✅ Recovered component after prose brackets")
+
+
+# ============================================================================
+# Test 20: Streaming - Partial Layout
+# ============================================================================
+
+async def test_stream_partial_layout():
+    """Test that a stream broken after some components yields an uncached, partial layout."""
+    print("\n🧪 Test 20: Streaming - Partial Layout")
+
+    service = await _fresh_service()
+
+    # The array never closes: the stream breaks after the first component
+    llm_text = '$$$[{"type":"SimpleComponent","data":{"title":"Before Break"}},{"type":"Simp'
+
+    with _patched_bedrock(create_mock_bedrock_text_response(llm_text), ConnectionError("reset")) as fake_bedrock:
+
+        result = await service.generate_layout("stream partial layout")
+
+        titles = [c["data"]["title"] for c in result["components"]]
+        assert titles == ["Before Break"], f"Should keep the streamed component, got {titles}"
+        assert result.get("partial") is True, "Result should be marked partial"
+        assert not result.get("fallback"), "Partial layout should not fall back"
+
+        await service.generate_layout("stream partial layout")
+        assert fake_bedrock.invoke_count == 2, "Partial layouts should not be cached"
+
+        print(f"   ✅ Partial layout with {len(titles)} component(s), not cached")
+
+
+# ============================================================================
+# Test 21: Streaming - Completion Result
+# ============================================================================
+
+async def test_stream_on_complete():
+    """Test that on_complete reports cache and timing info after the last component."""
+    print("\n🧪 Test 21: Streaming - Completion Result")
+
+    service = await _fresh_service()
+
+    mock_components = [{"type": "SimpleComponent", "data": {"title": "Reported"}}]
+
+    with _patched_bedrock(create_mock_bedrock_response(mock_components)):
+
+        results = []
+        for _ in range(2):
+            components = [
+                component async for component in
+                service.generate_layout_stream("stream on complete", on_complete=results.append)
+            ]
+            assert len(components) == 1, f"Should stream 1 component, got {len(components)}"
+
+        assert [r["from_cache"] for r in results] == [False, True], \
+            f"Second stream should be a cache hit: {[r['from_cache'] for r in results]}"
+        assert all("processing_time_ms" in r for r in results), "Results should report processing time"
+        assert results[0]["components"] == components, "Result should carry the streamed components"
+
+        print(f"   ✅ from_cache: {[r['from_cache'] for r in results]}")
+
+
 # ============================================================================
 # Test Runner
 # ============================================================================
 
+# (name, test) pairs in run order
+_TESTS = (
+    ("Basic Plan Generation", test_basic_plan_generation),
+    ("Chart Detection", test_chart_detection),
+    ("Table Detection", test_table_detection),
+    ("Cache Hit", test_cache_hit),
+    ("Invalid JSON Recovery", test_invalid_json_recovery),
+    ("Component Validation", test_component_validation),
+    ("Multi-Component Response", test_multi_component_response),
+    ("Cache Clear", test_cache_clear),
+    ("Half-Fenced JSON Recovery", test_half_fenced_json_recovery),
+    ("Streaming - Split Chunks", test_stream_split_chunks),
+    ("Streaming - Escaped Quotes", test_stream_escaped_quotes),
+    ("Streaming - Invalid Items Skipped", test_stream_invalid_item_skipped),
+    ("Streaming - MAX_COMPONENTS Cut-off", test_stream_max_components),
+    ("Streaming - Fallback", test_stream_fallback),
+    ("Streaming - Lenient JSON", test_stream_lenient_json),
+    ("Single-Flight Deduplication", test_single_flight),
+    ("LRU Eviction", test_cache_lru_eviction),
+    ("Streaming - Single-Flight", test_stream_single_flight),
+    ("Streaming - Whole-Text Recovery", test_stream_whole_text_recovery),
+    ("Streaming - Partial Layout", test_stream_partial_layout),
+    ("Streaming - Completion Result", test_stream_on_complete),
+)
+
+
 async def run_all_tests():
     """Run all Phase 6 tests."""
     print("=" * 70)
     print("🧠 PHASE 6: LLM INTEGRATION SERVICE - TEST SUITE")
     print("=" * 70)
 
-    tests = [
-        ("Basic Plan Generation", test_basic_plan_generation),
-        ("Chart Detection", test_chart_detection),
-        ("Table Detection", test_table_detection),
-        ("Cache Hit", test_cache_hit),
-        ("Invalid JSON Recovery", test_invalid_json_recovery),
-        ("Component Validation", test_component_validation),
-        ("Multi-Component Response", test_multi_component_response),
-        ("Cache Clear", test_cache_clear),
-    ]
-
     passed = 0
     failed = 0
 
-    for test_name, test_func in tests:
+    for test_name, test_func in _TESTS:
         try:
             await test_func()
             passed += 1
@@ -1,5 +1,5 @@
 """Utilities package for StreamForge backend."""
 
-from .id_generator import generate_uuid7
+from .id_generator import generate_uuid7, generate_component_ids
 
-__all__ = ["generate_uuid7"]
+__all__ = ["generate_uuid7", "generate_component_ids"]
@@ -5,7 +5,7 @@ Provides UUID7 generation for time-ordered, unique identifiers.
 UUID7 is a time-ordered UUID that combines timestamp with random data.
 """
 
-import uuid
+import os
 import time
 from datetime import datetime
 
@@ -33,43 +33,39 @@ def generate_uuid7() -> str:
         >>> id2 = generate_uuid7()
         >>> id1 < id2  # True (time-ordered)
     """
-    # Get current timestamp in milliseconds
-    timestamp_ms = int(time.time() * 1000)
+    # Get current timestamp in milliseconds (integer path, no float rounding)
+    timestamp_ms = time.time_ns() // 1_000_000
 
-    # Generate random bytes for the rest
-    random_bytes = uuid.uuid4().bytes
+    # Random data straight from the OS (last 10 bytes)
+    return _format_uuid7(timestamp_ms, bytearray(os.urandom(10)))
 
-    # Construct UUID7:
-    # First 48 bits: timestamp
-    # Next 4 bits: version (0111 = 7)
-    # Remaining bits: random data with proper variant bits
 
-    # Extract timestamp bytes (48 bits = 6 bytes)
-    # Convert timestamp to 8 bytes first (minimum size for a full int),
-    # then take only the last 6 bytes [-6:] to fit the UUID7 format
-    # This ensures we have exactly 48 bits (6 bytes) of timestamp data
-    timestamp_bytes = timestamp_ms.to_bytes(8, byteorder='big')[-6:]
-
-    # Combine timestamp with random data
-    # Use format: timestamp (6 bytes) + random (10 bytes)
-    uuid_bytes = bytearray(16)
+def _format_uuid7(timestamp_ms: int, random_bytes: bytearray) -> str:
+    """
+    Assemble a UUID7 string from a timestamp and 10 random bytes.
 
-    # Copy timestamp (first 6 bytes)
-    uuid_bytes[0:6] = timestamp_bytes
+    Construct UUID7:
+    First 48 bits: timestamp
+    Next 4 bits: version (0111 = 7)
+    Remaining bits: random data with proper variant bits
 
-    # Copy random data (remaining 10 bytes)
-    uuid_bytes[6:16] = random_bytes[6:16]
+    Args:
+        timestamp_ms: Unix timestamp in milliseconds
+        random_bytes: 10 bytes of random data (modified in place)
 
+    Returns:
+        str: UUID7 string
+    """
     # Set version to 7 (bits 48-51)
-    uuid_bytes[6] = (uuid_bytes[6] & 0x0F) | 0x70  # 0111xxxx
+    random_bytes[0] = (random_bytes[0] & 0x0F) | 0x70  # 0111xxxx
 
     # Set variant to RFC 4122 (bits 64-65)
-    uuid_bytes[8] = (uuid_bytes[8] & 0x3F) | 0x80  # 10xxxxxx
-
-    # Convert to UUID and return as string
-    result_uuid = uuid.UUID(bytes=bytes(uuid_bytes))
+    random_bytes[2] = (random_bytes[2] & 0x3F) | 0x80  # 10xxxxxx
 
-    return str(result_uuid)
+    # Timestamp (first 6 bytes = 48 bits), then the random data, formatted
+    # as 8-4-4-4-12 hex directly (no uuid.UUID object needed)
+    h = timestamp_ms.to_bytes(6, byteorder='big').hex() + random_bytes.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
 
 
 def generate_component_id() -> str:
@@ -85,6 +81,38 @@ def generate_component_id() -> str:
     return generate_uuid7()
 
 
+def generate_component_ids(n: int) -> list[str]:
+    """
+    Generate ``n`` UUID7 component IDs in one batch.
+
+    Reads the clock once and pulls all random data with a single os.urandom
+    call. The 12 bits after the version hold a per-batch sequence number, so
+    IDs sort in the order they were generated; every 4096 IDs the timestamp
+    advances by one millisecond to keep that order.
+
+    Args:
+        n: Number of IDs to generate
+
+    Returns:
+        list[str]: UUID7 strings in ascending order
+
+    Example:
+        >>> ids = generate_component_ids(3)
+        >>> ids == sorted(ids)  # True
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bytes = os.urandom(10 * n)
+
+    ids = [""] * n
+    for i in range(n):
+        ms_offset, sequence = divmod(i, 4096)
+        chunk = bytearray(random_bytes[i * 10:i * 10 + 10])
+        chunk[0] = sequence >> 8  # Version nibble is set by _format_uuid7
+        chunk[1] = sequence & 0xFF
+        ids[i] = _format_uuid7(timestamp_ms + ms_offset, chunk)
+    return ids
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Generate some UUIDs to verify time-ordering
@@ -98,3 +126,7 @@ if __name__ == "__main__":
     uuids = [generate_uuid7() for _ in range(10)]
     sorted_uuids = sorted(uuids)
     print(f"\nTime-ordered: {uuids == sorted_uuids}")
+
+    # Batched IDs are ordered even within one millisecond
+    batch = generate_component_ids(10)
+    print(f"Batch time-ordered: {batch == sorted(batch)}")